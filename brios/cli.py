@@ -3,7 +3,7 @@ import sys
 import time
 import asyncio
 import argparse
-from typing import Optional
+from typing import Any, Callable, List, Optional
 
 from brios import __version__
 from brios.core.utils import (
@@ -15,6 +15,8 @@ from brios.core.utils import (
     PID_FILE,
     LOG_FILE,
     determine_target_address,
+    remove_file,
+    write_pid_file,
 )
 from brios.core.config import (
     TARGET_DEVICE_MAC_ADDRESS,
@@ -30,14 +32,176 @@ from brios.core.config import (
     LOCK_LOOP_WINDOW,
     LOCK_LOOP_PENALTY,
 )
-from brios.core.scanner import DeviceScanner
-from brios.core.monitor import DeviceMonitor
-from brios.core.service import ServiceManager
+from brios.core.service import (
+    DAEMON_OPTIONS,
+    ServiceManager,
+    notify_daemon_ready,
+)
 from brios.core.updater import check_for_update, perform_update
 
+# Printed when the user stops a foreground run with Ctrl+C.
+_INTERRUPTED_BANNER = (
+    f"\n{Colors.YELLOW}{'─' * 50}{Colors.RESET}\n"
+    f"{Colors.YELLOW}⚠{Colors.RESET}  {Colors.BOLD}"
+    f"Monitoring Interrupted{Colors.RESET}\n   Reason:    "
+    f"User requested stop (Ctrl+C)\n   Status:    "
+    f"{Colors.GREEN}✓{Colors.RESET} Gracefully terminated\n"
+    f"{Colors.YELLOW}{'─' * 50}{Colors.RESET}\n"
+)
+
+# Service-control commands that are usually run on their own, mapped to
+# the (dest, value) they set. A bare invocation of one of these skips
+# building the argument parser (see _parse_fast_path).
+_FAST_PATH_COMMANDS = {
+    "--status": ("status", True),
+    "--stop": ("stop", "now"),
+    "--restart": ("restart", True),
+}
+
+
+# Target options a daemon command line may carry, mapped to their dest.
+_DAEMON_TARGET_OPTIONS = {
+    "--target-mac": "target_mac",
+    "--target-uuid": "target_uuid",
+}
+
+
+def _default_namespace() -> argparse.Namespace:
+    """Returns the Namespace setup_parser() produces for no arguments."""
+    return argparse.Namespace(
+        start=False,
+        stop=False,
+        d=False,
+        w=False,
+        restart=False,
+        status=False,
+        update=False,
+        scanner=None,
+        target_mac=None,
+        target_uuid=None,
+        macos_use_bdaddr=False,
+        verbose=False,
+        file_logging=False,
+        daemon=False,
+    )
+
+
+def _parse_daemon_command(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parses the command line ServiceManager builds for the daemon.
+
+    Only the exact shape written by ServiceManager._reconstruct_command()
+    is recognised: an optional target option and address, an optional
+    ``-m``, then the fixed daemon options.
+
+    Args:
+        argv: The command-line arguments, without the program name.
+
+    Returns:
+        The Namespace setup_parser() would produce for ``argv``, or None
+        if the arguments need the full parser.
+    """
+    tail = len(DAEMON_OPTIONS)
+    if tuple(argv[-tail:]) != DAEMON_OPTIONS:
+        return None
+    rest = argv[:-tail]
+    args = _default_namespace()
+    args.file_logging = args.verbose = args.daemon = True
+    if rest[-1:] == ["-m"]:
+        args.macos_use_bdaddr = True
+        rest = rest[:-1]
+    if rest:
+        if (
+            len(rest) != 2
+            or rest[0] not in _DAEMON_TARGET_OPTIONS
+            or rest[1].startswith("-")
+        ):
+            return None
+        setattr(args, _DAEMON_TARGET_OPTIONS[rest[0]], rest[1])
+    return args
+
+
+def _parse_fast_path(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parses common command lines without building the parser.
+
+    Handles a lone service-control flag and the daemon's own command line,
+    so neither pays for constructing the full argument parser.
+
+    Args:
+        argv: The command-line arguments, without the program name.
+
+    Returns:
+        The Namespace setup_parser() would produce for ``argv``, or None
+        if the arguments need the full parser.
+    """
+    if len(argv) == 1 and argv[0] in _FAST_PATH_COMMANDS:
+        args = _default_namespace()
+        dest, value = _FAST_PATH_COMMANDS[argv[0]]
+        setattr(args, dest, value)
+        return args
+    return _parse_daemon_command(argv)
+
+
+class _TargetAddressAction(argparse.Action):
+    """Stores a target address, using the configured one for a bare flag.
+
+    Resolving the default at parse time means the rest of the program only
+    ever sees real addresses, never a placeholder.
+    """
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: Optional[str] = None,
+    ) -> None:
+        """Stores the given address or the configured default.
+
+        Args:
+            parser: The parser handling the option.
+            namespace: The namespace receiving the address.
+            values: The address given on the command line, or None.
+            option_string: The option string that was used.
+        """
+        if values is None:
+            values = self.const
+            if not values:
+                parser.error(
+                    f"{option_string} needs an address: none is configured"
+                    " in .env"
+                )
+        setattr(namespace, self.dest, values)
+
+
+class _LazyEpilogParser(argparse.ArgumentParser):
+    """An ArgumentParser that renders its help epilog on first use.
+
+    The epilog is only shown by ``--help``, so building the multi-kilobyte
+    text is deferred until help is actually formatted.
+    """
+
+    def __init__(
+        self, *args: Any, epilog_factory: Callable[[], str], **kwargs: Any
+    ) -> None:
+        """Initializes the parser.
+
+        Args:
+            *args: Positional arguments for argparse.ArgumentParser.
+            epilog_factory: Callable returning the epilog text.
+            **kwargs: Keyword arguments for argparse.ArgumentParser.
+        """
+        super().__init__(*args, **kwargs)
+        self._epilog_factory = epilog_factory
 
-# Apply patch immediately
-apply_robust_bleak_patch()
+    def format_help(self) -> str:
+        """Formats the help message, building the epilog if needed.
+
+        Returns:
+            The full help text.
+        """
+        if self.epilog is None:
+            self.epilog = self._epilog_factory()
+        return super().format_help()
 
 
 class Application:
@@ -73,10 +237,21 @@ class Application:
 
     async def run(self) -> None:
         """Parses arguments and delegates tasks to the appropriate component."""
+        if not self.run_service():
+            await self.run_async()
+
+    def run_service(self) -> bool:
+        """Runs the synchronous update and service-control commands.
+
+        These never touch Bluetooth, so they run without an event loop.
+
+        Returns:
+            True if a command was handled, False if a scanner or monitor
+            workflow should run instead.
+        """
         if self.args.update:
             perform_update(__version__)
-            return
-        if self.args.status:
+        elif self.args.status:
             self.service_manager.display_status(
                 update_available=self.update_available,
             )
@@ -109,7 +284,18 @@ class Application:
             self.service_manager.start(
                 update_available=self.update_available,
             )
-        elif self.args.scanner is not None:
+        else:
+            return False
+        return True
+
+    async def run_async(self) -> None:
+        """Runs the scanner or the foreground monitor."""
+        if self.args.scanner is not None:
+            # bleak is only imported (and patched) by the BLE workflows, so
+            # service-control commands start without loading it.
+            from brios.core.scanner import DeviceScanner
+
+            apply_robust_bleak_patch()
             scanner = DeviceScanner(
                 self.args.scanner, self.args.macos_use_bdaddr, self.args.verbose
             )
@@ -125,6 +311,10 @@ class Application:
             print(f"Run '{sys.argv[0]} --help' for usage information")
             return
 
+        from brios.core.monitor import DeviceMonitor
+
+        apply_robust_bleak_patch()
+
         flags = Flags(
             daemon_mode=self.args.daemon,
             file_logging=self.args.file_logging,
@@ -141,26 +331,27 @@ class Application:
 
         if flags.daemon_mode:
             try:
-                with open(PID_FILE, "w") as f:
-                    f.write(str(os.getpid()))
-            except IOError:
+                write_pid_file(PID_FILE, os.getpid())
+            except OSError:
                 print(f"{Colors.RED}✗{Colors.RESET} Failed to write PID file")
                 sys.exit(1)
 
         try:
-            await monitor.run()
+            await monitor.run(
+                on_ready=notify_daemon_ready if flags.daemon_mode else None
+            )
         finally:
-            if flags.daemon_mode and os.path.exists(PID_FILE):
-                os.remove(PID_FILE)
+            if flags.daemon_mode:
+                remove_file(PID_FILE)
 
     @staticmethod
-    def setup_parser() -> argparse.ArgumentParser:
-        """Sets up the command-line argument parser.
+    def _help_epilog() -> str:
+        """Builds the long-form help text shown after the option list.
 
         Returns:
-            The configured argument parser.
+            The help epilog.
         """
-        help_epilog = f"""
+        return f"""
         DESCRIPTION:
         {__app_name__} ({__app_full_name__})
         
@@ -237,7 +428,9 @@ class Application:
         • TX_POWER_AT_1M               RSSI at 1 meter (default: -59 dBm)
         • PATH_LOSS_EXPONENT           Environment factor (default: 2.8)
         • SAMPLE_WINDOW                Signal smoothing samples (default: 12)
-        • SMOOTHING_METHOD             Method to smooth RSSI (median/mean)
+        • SMOOTHING_METHOD             Method to smooth RSSI (median/mean/ema/kalman)
+        • LOG_RSSI_DELTA_DBM           RSSI change before logging (default: 1.0)
+        • LOG_DISTANCE_DELTA_M         Distance change before logging (default: 0.25)
         • OUT_OF_RANGE_DEBOUNCE_COUNT  Consecutive checks to confirm lock (1-9)
         • GRACE_PERIOD_SECONDS         Post-unlock grace period (default: 30)
         • LOCK_LOOP_THRESHOLD          Lock events before pause (default: 3)
@@ -262,13 +455,21 @@ class Application:
         For more information, visit: https://github.com/Piero24/B.R.I.O.S.
         Documentation: https://piero24.github.io/B.R.I.O.S./
         """
-        parser = argparse.ArgumentParser(
+
+    @staticmethod
+    def setup_parser() -> argparse.ArgumentParser:
+        """Sets up the command-line argument parser.
+
+        Returns:
+            The configured argument parser.
+        """
+        parser = _LazyEpilogParser(
             description=(
                 f"{__app_name__} - {__app_full_name__}\n"
                 "Device proximity monitor with distance-based alerting"
             ),
             formatter_class=argparse.RawTextHelpFormatter,
-            epilog=help_epilog,
+            epilog_factory=Application._help_epilog,
         )
 
         # --- Version ---
@@ -339,7 +540,8 @@ class Application:
             "--target-mac",
             "-tm",
             nargs="?",
-            const="USE_DEFAULT",
+            const=TARGET_DEVICE_MAC_ADDRESS,
+            action=_TargetAddressAction,
             type=str,
             metavar="ADDRESS",
             help="monitor device by MAC address (recommended)",
@@ -348,7 +550,8 @@ class Application:
             "--target-uuid",
             "-tu",
             nargs="?",
-            const="USE_DEFAULT",
+            const=TARGET_DEVICE_UUID_ADDRESS,
+            action=_TargetAddressAction,
             type=str,
             metavar="UUID",
             help="monitor device by UUID (macOS privacy mode)",
@@ -386,15 +589,20 @@ def main() -> None:
     Parses arguments, performs a non-blocking update check, and runs the
     appropriate application workflow.
     """
-    parser = Application.setup_parser()
-    args = parser.parse_args()
+    args = _parse_fast_path(sys.argv[1:])
+    parser: Optional[argparse.ArgumentParser] = None
+    if args is None:
+        parser = Application.setup_parser()
+        args = parser.parse_args()
 
-    if args.scanner is not None and not (5 <= args.scanner <= 60):
-        parser.error("Scanner duration must be between 5 and 60 seconds.")
+        if args.scanner is not None and not (5 <= args.scanner <= 60):
+            parser.error("Scanner duration must be between 5 and 60 seconds.")
 
-    if getattr(args, "d", False) or getattr(args, "w", False):
-        if not getattr(args, "stop", False):
-            parser.error("-d and -w parameters can only be used with --stop.")
+        if getattr(args, "d", False) or getattr(args, "w", False):
+            if not getattr(args, "stop", False):
+                parser.error(
+                    "-d and -w parameters can only be used with --stop."
+                )
 
     is_service_command = (
         args.start or args.stop or args.restart or args.status or args.daemon
@@ -406,6 +614,7 @@ def main() -> None:
 
     # If no mode flags are provided, we check if we can default to monitoring
     if not is_mode_command and not is_service_command and not is_update_command:
+        assert parser is not None, "fast-path commands are service commands"
         parser.error(
             "one of the following arguments is required: "
             "--scanner/-s, --target-mac/-tm, --target-uuid/-tu, "
@@ -437,17 +646,13 @@ def main() -> None:
 
     try:
         app = Application(args, update_available=update_available)
-        asyncio.run(app.run())
+        # Service-control commands are synchronous; only the BLE
+        # workflows need an event loop.
+        if not app.run_service():
+            asyncio.run(app.run_async())
     except KeyboardInterrupt:
         if not (args.start or args.restart):
-            print(
-                f"\n{Colors.YELLOW}{'─' * 50}{Colors.RESET}\n"
-                f"{Colors.YELLOW}⚠{Colors.RESET}  {Colors.BOLD}"
-                f"Monitoring Interrupted{Colors.RESET}\n   Reason:    "
-                f"User requested stop (Ctrl+C)\n   Status:    "
-                f"{Colors.GREEN}✓{Colors.RESET} Gracefully terminated\n"
-                f"{Colors.YELLOW}{'─' * 50}{Colors.RESET}\n"
-            )
+            print(_INTERRUPTED_BANNER)
         sys.exit(130)
     except Exception as e:
         # In daemon mode, stdout/stderr go to /dev/null or the log file.
@@ -456,7 +661,7 @@ def main() -> None:
             import traceback
 
             try:
-                with open(LOG_FILE, "a") as crash_log:
+                with open(LOG_FILE, "a", encoding="utf-8") as crash_log:
                     from datetime import datetime
 
                     ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -464,7 +669,6 @@ def main() -> None:
                         f"[{ts}] DAEMON CRASH: {e}\n"
                         f"{traceback.format_exc()}\n"
                     )
-                    crash_log.flush()
             except Exception:
                 pass
         print(f"{Colors.RED}✗ FATAL ERROR:{Colors.RESET} {e}")
@@ -30,8 +30,14 @@ TX_POWER_AT_1M = int(os.getenv("TX_POWER_AT_1M", "-59"))
 
 # The path-loss exponent (n) for the environment. This value describes the rate
 # at which the signal strength decreases with distance. Common values range
-# from 2.0 (free space) to 4.0 (obstructed environments).
-PATH_LOSS_EXPONENT = float(os.getenv("PATH_LOSS_EXPONENT", "2.8"))
+# from 2.0 (free space) to 4.0 (obstructed environments). Must be positive,
+# as the distance model divides by it.
+try:
+    PATH_LOSS_EXPONENT = float(os.getenv("PATH_LOSS_EXPONENT", "2.8"))
+    if not PATH_LOSS_EXPONENT > 0.0:
+        raise ValueError(PATH_LOSS_EXPONENT)
+except ValueError:
+    PATH_LOSS_EXPONENT = 2.8
 
 # The number of recent RSSI samples to average for smoothing out fluctuations.
 SAMPLE_WINDOW = int(os.getenv("SAMPLE_WINDOW", "12"))
@@ -39,9 +45,45 @@ SAMPLE_WINDOW = int(os.getenv("SAMPLE_WINDOW", "12"))
 # The distance (in meters) beyond which a device is considered "out of range."
 DISTANCE_THRESHOLD_M = float(os.getenv("DISTANCE_THRESHOLD_M", "2.0"))
 
-# The method used to smooth RSSI values. Can be 'median' or 'mean'.
+# The method used to smooth RSSI values. Can be 'median', 'mean', 'ema' or
+# 'kalman' (the window median fed through a scalar Kalman filter).
 SMOOTHING_METHOD = os.getenv("SMOOTHING_METHOD", "median").lower()
 
+# Weight of the newest sample when SMOOTHING_METHOD is 'ema', in (0, 1].
+# Defaults to 2 / (SAMPLE_WINDOW + 1) so the exponential average tracks a
+# window of similar length; lower values smooth more but react slower.
+try:
+    EMA_ALPHA = float(os.getenv("EMA_ALPHA", str(2.0 / (SAMPLE_WINDOW + 1))))
+    if not 0.0 < EMA_ALPHA <= 1.0:
+        raise ValueError(EMA_ALPHA)
+except ValueError:
+    EMA_ALPHA = 2.0 / (SAMPLE_WINDOW + 1)
+
+# Process and measurement noise variances (dBm^2) of the Kalman filter used
+# when SMOOTHING_METHOD is 'kalman'. A lower process noise trusts the current
+# estimate more; a lower measurement noise follows the median more closely.
+# The process noise must be >= 0 and the measurement noise > 0.
+try:
+    KALMAN_PROCESS_NOISE = float(os.getenv("KALMAN_PROCESS_NOISE", "0.5"))
+    if not KALMAN_PROCESS_NOISE >= 0.0:
+        raise ValueError(KALMAN_PROCESS_NOISE)
+except ValueError:
+    KALMAN_PROCESS_NOISE = 0.5
+try:
+    KALMAN_MEASUREMENT_NOISE = float(
+        os.getenv("KALMAN_MEASUREMENT_NOISE", "4.0")
+    )
+    if not KALMAN_MEASUREMENT_NOISE > 0.0:
+        raise ValueError(KALMAN_MEASUREMENT_NOISE)
+except ValueError:
+    KALMAN_MEASUREMENT_NOISE = 4.0
+
+# Minimum change in smoothed RSSI (dBm) or estimated distance (m) since the
+# last status line before a new one is logged. Set both to 0 to log every
+# advertisement.
+LOG_RSSI_DELTA_DBM = float(os.getenv("LOG_RSSI_DELTA_DBM", "1.0"))
+LOG_DISTANCE_DELTA_M = float(os.getenv("LOG_DISTANCE_DELTA_M", "0.25"))
+
 # The number of consecutive out-of-range readings required before locking the Mac.
 # Bounded between 1 and 9.
 try:
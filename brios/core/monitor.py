@@ -1,11 +1,15 @@
 import os
 import sys
+import math
 import time
+import re
+import signal
 import asyncio
+import traceback
 import subprocess
+from array import array
 from datetime import datetime
-from collections import deque
-from typing import Optional, TextIO, Deque, Tuple
+from typing import Any, Callable, Dict, Optional, TextIO, List, Tuple
 
 from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
@@ -16,8 +20,11 @@ from .utils import (
     __app_name__,
     estimate_distance,
     smooth_rssi,
+    signal_strength,
+    RssiBuffer,
     LOG_FILE,
     PAUSE_FILE,
+    remove_file,
 )
 from . import system
 
@@ -33,9 +40,122 @@ from .config import (
     TX_POWER_AT_1M,
     PATH_LOSS_EXPONENT,
     OUT_OF_RANGE_DEBOUNCE_COUNT,
+    SMOOTHING_METHOD,
+    EMA_ALPHA,
+    KALMAN_PROCESS_NOISE,
+    KALMAN_MEASUREMENT_NOISE,
+    LOG_RSSI_DELTA_DBM,
+    LOG_DISTANCE_DELTA_M,
 )
 from .utils import Flags
 
+# How long (seconds) a screen-lock probe result is reused before the
+# CoreGraphics session dictionary is queried again.
+_LOCK_STATE_TTL_SECONDS = 1.0
+
+# Upper bound (seconds) a lock handler waits for the watchdog's unlock
+# wake-up before probing the lock state itself.
+_UNLOCK_RECHECK_SECONDS = 10.0
+
+# How often (seconds) the watchdog flushes buffered status lines to the
+# log file. Alerts, lock events and shutdown still flush immediately.
+_LOG_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Bound on the memoized address matches. Random private addresses rotate,
+# so the cache is simply reset when it fills up.
+_ADDRESS_CACHE_SIZE = 1024
+
+# A colon-separated MAC address, as BlueZ reports device addresses.
+_MAC_ADDRESS_RE = re.compile(r"^[0-9A-F]{2}(?::[0-9A-F]{2}){5}$")
+
+# Bound on the memoized smoothed-RSSI -> distance results.
+_DISTANCE_CACHE_SIZE = 512
+
+# Minimum time (seconds) between two malformed-packet reports. Bleak can
+# raise these many times per second while the Mac is locked.
+_BLEAK_ERROR_REPORT_INTERVAL = 5.0
+
+# Watchdog tick bounds (seconds). While the target is heard and no lock is
+# in progress the tick backs off by _WATCHDOG_BACKOFF up to the maximum;
+# anything else snaps it back to the minimum.
+_WATCHDOG_MIN_INTERVAL = 2.0
+_WATCHDOG_MAX_INTERVAL = 10.0
+_WATCHDOG_BACKOFF = 1.5
+
+# Status line templates, filled with str.format_map() in _log_status.
+_STATUS_TEMPLATE = (
+    "[{ts}] RSSI: {raw:4d} dBm → Smoothed: {sm:5.1f} dBm │ Distance: {d:5.2f}m"
+)
+_STATUS_TEMPLATE_RICH = (
+    f"{Colors.BLUE}[{{ts}}]{Colors.RESET} RSSI: {{raw:4d}} dBm → "
+    f"Smoothed: {{sm:5.1f}} dBm │ "
+    f"Distance: {Colors.BOLD}{{d:5.2f}}m{Colors.RESET} │ "
+    f"Signal: {{sc}}{{sl}}{Colors.RESET}"
+)
+
+# Printed (verbose) for each out-of-range reading ignored during the
+# post-unlock grace period; filled with the seconds since resume.
+_GRACE_IGNORED_TEMPLATE = (
+    f"{Colors.GREY}[Grace Period] Ignoring trigger "
+    f"({{:.1f}}/{GRACE_PERIOD_SECONDS}s){Colors.RESET}"
+)
+
+# Horizontal rules, and pre-rendered colored fragments of the alert and
+# error banners.
+_SEP_50 = "─" * 50
+_SEP_60 = "─" * 60
+_BAR_RED_50 = f"{Colors.RED}{_SEP_50}{Colors.RESET}"
+_BAR_RED_60 = f"{Colors.RED}{_SEP_60}{Colors.RESET}"
+_BAR_GREEN_60 = f"{Colors.GREEN}{_SEP_60}{Colors.RESET}"
+_BAR_YELLOW_60 = f"{Colors.YELLOW}{_SEP_60}{Colors.RESET}"
+
+# Range alert banners, filled with str.format() when an alert fires. The
+# device name is a field rather than baked in, as it may contain braces.
+_OUT_OF_RANGE_BANNER = (
+    f"\n{_BAR_RED_50}\n"
+    f"{Colors.RED}⚠{Colors.RESET}  "
+    f"{Colors.BOLD}ALERT: Device moved out of range{Colors.RESET}\n"
+    "   Device:    {name}\n"
+    f"   Distance:  ~{{d:.2f}}m (threshold: {DISTANCE_THRESHOLD_M}m)\n"
+    "   Time:      {ts}\n"
+    "   Action:    {status}\n"
+    f"{_BAR_RED_50}\n"
+)
+# Shown in the out-of-range banner while the lock command is still running.
+_LOCKING_STATUS = "🔒 Locking MacBook..."
+_BACK_IN_RANGE_BANNER = (
+    f"\n{_BAR_GREEN_60}\n"
+    f"{Colors.GREEN}✓{Colors.RESET}  "
+    f"{Colors.BOLD}Device Back in Range{Colors.RESET}\n"
+    "   Device:    {name}\n"
+    f"   Distance:  ~{{d:.2f}}m (Threshold: {DISTANCE_THRESHOLD_M}m)\n"
+    "   Time:      {ts}\n"
+    "   Status:    🔓 Ready to unlock MacBook\n"
+    f"{_BAR_GREEN_60}\n"
+)
+
+_MALFORMED_PACKET_BANNER = "\n".join(
+    (
+        "",
+        _BAR_YELLOW_60,
+        f"{Colors.YELLOW}DEBUG: Malformed Packet Ignored{Colors.RESET}",
+        f"{Colors.GREY}   └─> Cause: This is expected when the host Mac is "
+        f"locked or sleeping.{Colors.RESET}",
+        _BAR_YELLOW_60,
+        "",
+    )
+)
+_CALLBACK_ERROR_HEAD = "\n".join(
+    (
+        "",
+        _BAR_RED_60,
+        f"{Colors.RED}CRITICAL: Unexpected Callback Error{Colors.RESET}",
+        f"{Colors.GREY}   An error was caught, but the scanner will continue "
+        f"to run.{Colors.RESET}",
+        f"   └─> {Colors.BOLD}Error Details:{Colors.RESET} ",
+    )
+)
+
 
 class DeviceMonitor:
     """Manages a continuous monitoring session for a single BLE device.
@@ -51,14 +171,20 @@ class DeviceMonitor:
         update_available: The latest version string if an update is
             available, or None.
         rssi_buffer: A buffer to hold recent RSSI samples (dBm).
+        ema_rssi: The exponentially smoothed RSSI when SMOOTHING_METHOD is
+            'ema', or None until the first sample arrives.
+        kalman_rssi: The Kalman-filtered window median when SMOOTHING_METHOD
+            is 'kalman', or None until the window first fills.
         alert_triggered: Indicates if an out-of-range alert is active.
         log_file: The file object for logging output, if any.
         scanner: The Bleak scanner instance for BLE scanning.
         is_handling_lock: True if currently handling a screen lock state.
-        last_packet_time: Monotonic timestamp of the last packet received.
+        last_packet_time: Monotonic timestamp of the last packet received
+            from the target device.
         lock_handling_start_time: Timestamp when lock handling began.
         resume_time: Timestamp when monitoring was last resumed.
-        lock_history: History of recent lock events to detect loops.
+        _in_grace: True while alerts are suppressed after a resume.
+        lock_history: Ring of recent lock event timestamps to detect loops.
         is_paused: True if the monitor is currently paused by the user.
         _out_of_range_counter: Tracks consecutive times distance is above threshold.
     """
@@ -88,7 +214,11 @@ class DeviceMonitor:
         self.flags = flags
         self.update_available = update_available
 
-        self.rssi_buffer: Deque[int] = deque(maxlen=SAMPLE_WINDOW)
+        self.rssi_buffer = RssiBuffer(SAMPLE_WINDOW)
+        self._distance_cache: Dict[float, float] = {}
+        self.ema_rssi: Optional[float] = None
+        self.kalman_rssi: Optional[float] = None
+        self._kalman_variance: float = KALMAN_MEASUREMENT_NOISE
         self.alert_triggered: bool = False
         self.log_file: Optional[TextIO] = None
         self.is_handling_lock: bool = False
@@ -102,16 +232,77 @@ class DeviceMonitor:
         self._match_count: int = 0
         self._error_count: int = 0
         self._seen_addresses: set = set()
+
+        # Raw advertised address -> whether it is the target (see
+        # _detection_callback)
+        self._address_matches: Dict[Optional[str], bool] = {}
         self._address_dump_done: bool = False
 
+        # Cached "%H:%M:%S" timestamp, rebuilt only when the second changes
+        self._cached_ts_sec: int = 0
+        self._cached_ts_str: str = ""
+
+        # Values shown by the last status line, used to skip unchanged ones
+        self._last_logged_rssi: float = math.nan
+        self._last_logged_dist: float = math.nan
+        self._last_flush: float = time.monotonic()
+
         # Safety state
         self.resume_time: float = 0
-        self.lock_history: Deque[float] = deque(maxlen=LOCK_LOOP_THRESHOLD)
+        self._in_grace: bool = False
+        self._grace_timer: Optional[asyncio.TimerHandle] = None
+        self.lock_history = array("d", [0.0] * LOCK_LOOP_THRESHOLD)
+        self._lock_history_idx: int = 0
+        self._lock_history_count: int = 0
         self._out_of_range_counter: int = 0
 
-        self.scanner = BleakScanner(
+        # Memoized screen-lock probe (see _is_screen_locked)
+        self._lock_cache_ts: float = float("-inf")
+        self._lock_cache_val: bool = False
+        self._unlocked = asyncio.Event()
+
+        # Lock handling runs in one long-lived worker task (see _lock_worker);
+        # callers set this event instead of spawning handler tasks.
+        self._lock_trigger = asyncio.Event()
+        # Set by the watchdog heartbeat when it wakes the lock worker
+        self._scanner_frozen: bool = False
+        self._lock_worker_task: Optional["asyncio.Task[None]"] = None
+        self._alert_task: Optional["asyncio.Task[None]"] = None
+        self._watchdog_interval: float = _WATCHDOG_MIN_INTERVAL
+
+        # Set to end run(); SIGTERM (sent by `--stop`) sets it as well.
+        self._stop_event = asyncio.Event()
+
+        # When the last malformed-packet report was written
+        self._last_bleak_error_ts: float = float("-inf")
+
+        # Samples received since the last burst drain
+        self._pending_rssi: List[int] = []
+        self._drain_scheduled: bool = False
+
+        self.scanner = self._new_scanner()
+
+    def _new_scanner(self) -> BleakScanner:
+        """Creates a BleakScanner wired to this monitor's callback.
+
+        On Linux a MAC target is also passed to BlueZ as a discovery
+        ``Pattern``, so advertisements from other devices are dropped by
+        bluetoothd instead of reaching the callback. The address check in
+        _detection_callback stays as a safety net (the pattern also matches
+        name prefixes). CoreBluetooth has no per-device scan filter.
+
+        Returns:
+            A new, not yet started, BleakScanner instance.
+        """
+        bluez: Dict[str, Any] = {}
+        if sys.platform.startswith("linux") and _MAC_ADDRESS_RE.match(
+            self.target_address
+        ):
+            bluez["filters"] = {"Pattern": self.target_address}
+        return BleakScanner(
             detection_callback=self._detection_callback,
             cb={"use_bdaddr": self.use_bdaddr},
+            bluez=bluez,
         )
 
     def _print_start_status(self) -> None:
@@ -164,7 +355,7 @@ class DeviceMonitor:
             return
 
         print(f"\n{Colors.BOLD}Starting {__app_name__} Monitor{Colors.RESET}")
-        print("─" * 50)
+        print(_SEP_50)
         print(f"Target:     {TARGET_DEVICE_NAME} ({TARGET_DEVICE_TYPE})")
         print(f"Address:    {self.target_address}")
         print(f"Threshold:  {DISTANCE_THRESHOLD_M}m")
@@ -173,7 +364,7 @@ class DeviceMonitor:
         print(f"Samples:    {SAMPLE_WINDOW} readings")
         if self.use_bdaddr:
             print(f"Mode:       {Colors.BLUE}BD_ADDR (MAC){Colors.RESET}")
-        print("─" * 50)
+        print(_SEP_50)
 
         if self.flags.verbose and self.flags.file_logging:
             print(f"Output:     {Colors.GREEN}Terminal + File{Colors.RESET}")
@@ -209,53 +400,43 @@ class DeviceMonitor:
             device: The BLEDevice object discovered by the scanner.
             adv_data: The advertisement data associated with the device.
         """
-        self.last_packet_time = time.monotonic()
         self._callback_count += 1
-        is_locked = False
+        raw_addr = getattr(device, "address", None)
+
+        # Case-insensitive match, memoized per raw address string so the
+        # common reject path is a single dict lookup with no upper().
+        is_target = self._address_matches.get(raw_addr)
+        if is_target is None:
+            is_target = isinstance(raw_addr, str) and (
+                raw_addr.upper() == self.target_address
+            )
+            if len(self._address_matches) >= _ADDRESS_CACHE_SIZE:
+                self._address_matches.clear()
+            self._address_matches[raw_addr] = is_target
+
+        # Daemon diagnostic: collect unique addresses seen
+        if (
+            self.flags.daemon_mode
+            and self.log_file
+            and not self._address_dump_done
+        ):
+            self._record_seen_address(raw_addr)
+
+        if not is_target:
+            return
 
+        # Only the RSSI conversion can fail on a malformed advertisement,
+        # e.g. a missing or None value while the host is asleep.
         try:
-            # Normalize to uppercase for case-insensitive matching.
-            device_addr = device.address.upper() if device.address else ""
-
-            # Daemon diagnostic: collect unique addresses seen
-            if (
-                self.flags.daemon_mode
-                and self.log_file
-                and not self._address_dump_done
-            ):
-                self._seen_addresses.add(device_addr)
-                # After 500 callbacks, dump the addresses we've seen
-                if self._callback_count >= 500:
-                    self._address_dump_done = True
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    self.log_file.write(
-                        f"[{timestamp}] DIAGNOSTIC: Target address = "
-                        f"'{self.target_address}'\n"
-                    )
-                    self.log_file.write(
-                        f"[{timestamp}] DIAGNOSTIC: Unique addresses "
-                        f"seen ({len(self._seen_addresses)}): "
-                        f"{list(self._seen_addresses)[:20]}\n"
-                    )
-                    target_in_seen = self.target_address in self._seen_addresses
-                    self.log_file.write(
-                        f"[{timestamp}] DIAGNOSTIC: Target in seen = "
-                        f"{target_in_seen}\n"
-                    )
-                    self.log_file.flush()
-
-            if device_addr != self.target_address:
-                return
             current_rssi = int(adv_data.rssi)
-
-        except (AttributeError, TypeError) as exc:
+        except (AttributeError, TypeError, ValueError) as exc:
             self._error_count += 1
             self._handle_bleak_error(exc)
             return
-        except Exception as e:
-            self._error_count += 1
-            self._handle_generic_error(e)
-            return
+
+        # Only target packets count as liveness, so the watchdog heartbeat
+        # tracks the device rather than unrelated advertisers.
+        self.last_packet_time = time.monotonic()
 
         # Log first-time match for daemon diagnostics
         if not self._target_matched:
@@ -264,11 +445,81 @@ class DeviceMonitor:
                 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 self.log_file.write(
                     f"[{timestamp}] Target device FOUND - "
-                    f"address={device_addr}, rssi={current_rssi}\n"
+                    f"address={self.target_address}, rssi={current_rssi}\n"
                 )
                 self.log_file.flush()
         self._match_count += 1
 
+        # Advertisements tend to arrive in bursts; queue the sample and let
+        # a single drain on the next loop iteration process the whole burst.
+        self._pending_rssi.append(current_rssi)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            asyncio.get_running_loop().call_soon(self._drain_pending)
+
+    def _record_seen_address(self, raw_addr: Optional[str]) -> None:
+        """Collects advertised addresses for the daemon's diagnostic dump.
+
+        After 500 callbacks the unique addresses seen so far are written to
+        the log once, to help diagnose a target that never matches.
+
+        Args:
+            raw_addr: The address as advertised, or None.
+        """
+        try:
+            self._seen_addresses.add(raw_addr.upper() if raw_addr else "")
+            if self._callback_count < 500:
+                return
+            self._address_dump_done = True
+            assert self.log_file is not None
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.log_file.write(
+                f"[{timestamp}] DIAGNOSTIC: Target address = "
+                f"'{self.target_address}'\n"
+            )
+            self.log_file.write(
+                f"[{timestamp}] DIAGNOSTIC: Unique addresses "
+                f"seen ({len(self._seen_addresses)}): "
+                f"{list(self._seen_addresses)[:20]}\n"
+            )
+            target_in_seen = self.target_address in self._seen_addresses
+            self.log_file.write(
+                f"[{timestamp}] DIAGNOSTIC: Target in seen = "
+                f"{target_in_seen}\n"
+            )
+            self.log_file.flush()
+        except Exception as e:
+            self._error_count += 1
+            self._handle_generic_error(e)
+
+    def _drain_pending(self) -> None:
+        """Processes every RSSI sample queued since the last drain.
+
+        All queued samples are folded into the smoothing state, but the
+        distance estimate, status logging and alert checks run only once,
+        on the state after the newest sample.
+        """
+        self._drain_scheduled = False
+        samples = self._pending_rssi
+        if not samples:
+            return
+        self._pending_rssi = []
+
+        try:
+            self._process_batch(samples)
+        except Exception as e:
+            self._error_count += 1
+            self._handle_generic_error(e)
+
+    def _process_batch(self, samples: List[int]) -> None:
+        """Runs the smoothing, logging and alert checks for one drain.
+
+        Args:
+            samples: The queued RSSI samples, oldest first; not empty.
+        """
+        for rssi in samples[:-1]:
+            self._add_sample(rssi)
+        current_rssi = samples[-1]
         smoothed_rssi, distance_m = self._process_signal(current_rssi)
         if distance_m is None or smoothed_rssi is None:
             return
@@ -277,28 +528,59 @@ class DeviceMonitor:
 
         if distance_m > DISTANCE_THRESHOLD_M:
             # Check for Grace Period
-            time_since_resume = time.monotonic() - self.resume_time
-            if time_since_resume < GRACE_PERIOD_SECONDS:
+            if self._in_grace:
                 if self.flags.verbose:
-                    print(
-                        f"{Colors.GREY}[Grace Period] Ignoring trigger "
-                        f"({time_since_resume:.1f}/{GRACE_PERIOD_SECONDS}s){Colors.RESET}"
-                    )
+                    time_since_resume = time.monotonic() - self.resume_time
+                    print(_GRACE_IGNORED_TEMPLATE.format(time_since_resume))
                 return
 
             self._out_of_range_counter += 1
             if (
                 self._out_of_range_counter >= OUT_OF_RANGE_DEBOUNCE_COUNT
                 and not self.alert_triggered
+                and not self._alert_pending()
             ):
-                is_locked = self._trigger_out_of_range_alert(distance_m)
+                # Set before the lock runs so later drains do not re-alert
+                self.alert_triggered = True
+                self._alert_task = asyncio.create_task(
+                    self._trigger_out_of_range_alert(distance_m)
+                )
         else:
             self._out_of_range_counter = 0
-            if distance_m <= DISTANCE_THRESHOLD_M and self.alert_triggered:
+            if (
+                distance_m <= DISTANCE_THRESHOLD_M
+                and self.alert_triggered
+                and not self._alert_pending()
+            ):
                 self._trigger_in_range_alert(distance_m)
 
-        if is_locked:
-            asyncio.create_task(self._handle_screen_lock())
+    def _alert_pending(self) -> bool:
+        """Returns whether an out-of-range alert is still locking the Mac.
+
+        Range alerts are held back until it finishes, so a back-in-range
+        banner never precedes the lock result and locks never overlap.
+        """
+        return self._alert_task is not None and not self._alert_task.done()
+
+    async def _lock_worker(self) -> None:
+        """Runs the lock handler each time _lock_trigger is set.
+
+        Requests made while a handler is already running are dropped, as
+        the running handler restarts the scanner once the screen unlocks.
+        """
+        while True:
+            await self._lock_trigger.wait()
+            self._watchdog_interval = _WATCHDOG_MIN_INTERVAL
+            try:
+                await self._handle_screen_lock()
+            finally:
+                self._lock_trigger.clear()
+
+    def _start_lock_worker(self) -> None:
+        """Starts (or restarts) the background lock handling worker."""
+        if self._lock_worker_task is not None:
+            self._lock_worker_task.cancel()
+        self._lock_worker_task = asyncio.create_task(self._lock_worker())
 
     async def _handle_screen_lock(self) -> None:
         """Handles the screen lock state by re-establishing the scanner.
@@ -306,9 +588,16 @@ class DeviceMonitor:
         Runs in the background while the screen is locked, periodically
         checking the lock status.  When the screen is unlocked, it restarts
         the scanner and clears the RSSI buffer to ensure fresh readings.
+
+        When woken by the watchdog heartbeat while the screen is unlocked,
+        the frozen scanner is replaced by a new one straight away. Such a
+        restart is not a lock event and does not count towards the lock
+        loop protection.
         """
         if self.is_handling_lock:
             return
+        frozen = self._scanner_frozen and not self._is_screen_locked()
+        self._scanner_frozen = False
 
         self.is_handling_lock = True
         self.lock_handling_start_time = time.monotonic()
@@ -328,127 +617,18 @@ class DeviceMonitor:
                         f"{Colors.YELLOW}Warning: Scanner stop failed: {e}{Colors.RESET}"
                     )
 
-            timestamp = datetime.now().strftime("%H:%M:%S")
-
-            if self.flags.daemon_mode:
-                msg = f"[{timestamp}] Screen locked - Scanner paused"
-                if self.log_file:
-                    self.log_file.write(msg + "\n")
-                    self.log_file.flush()
-            elif self.flags.verbose:
-                print(
-                    f"{Colors.YELLOW}[{timestamp}]{Colors.RESET} Screen locked "
-                    f"→ Scanner {Colors.BOLD}{Colors.YELLOW}Paused{Colors.RESET}"
-                    f" │ Monitoring: Waiting for unlock"
-                )
-
-            if self.flags.file_logging and self.log_file:
-                self.log_file.write(
-                    f"[{timestamp}] Screen locked - Scanner paused\n"
-                )
-                self.log_file.flush()
-
-            await asyncio.sleep(2)
-
-            loop_count = 0
-            is_waiting = False
-            while system.is_screen_locked():
-                loop_count += 1
-
-                if not is_waiting:
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    is_waiting = True
-
-                    if self.flags.daemon_mode:
-                        if self.log_file:
-                            self.log_file.write(
-                                f"[{timestamp}] "
-                                f"Screen still locked - Waiting for unlock\n"
-                            )
-                            self.log_file.flush()
-                    elif self.flags.verbose:
-                        print(
-                            f"{Colors.GREY}[{timestamp}]{Colors.RESET} "
-                            f"Screen locked → Waiting..."
-                        )
-
-                    if self.flags.file_logging and self.log_file:
-                        self.log_file.write(
-                            f"[{timestamp}] "
-                            f"Screen still locked - Waiting for unlock\n"
-                        )
-                        self.log_file.flush()
-
-                await asyncio.sleep(2)
-
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            total_time = loop_count * 2
-
-            self.rssi_buffer.clear()
-
-            if self.flags.daemon_mode:
-                if self.log_file:
-                    self.log_file.write(
-                        f"[{timestamp}] Screen unlocked - "
-                        f"Reconnecting scanner (locked for {total_time}s)\n"
-                    )
-                    self.log_file.flush()
-            elif self.flags.verbose:
-                print(
-                    f"{Colors.GREEN}[{timestamp}]{Colors.RESET} Screen unlocked "
-                    f"→ Reconnecting │ Locked: {total_time}s │ "
-                    f"RSSI buffer: Cleared"
-                )
-
-            if self.flags.file_logging and self.log_file:
-                self.log_file.write(
-                    f"[{timestamp}] Screen unlocked - Reconnecting scanner "
-                    f"(locked for {total_time}s)\n"
-                )
-                self.log_file.flush()
-
-            # --- Lock Loop Protection ---
-            now = time.monotonic()
-            self.lock_history.append(now)
-
-            if len(self.lock_history) == LOCK_LOOP_THRESHOLD:
-                # Check if all events happened within window
-                if now - self.lock_history[0] < LOCK_LOOP_WINDOW:
-                    msg = (
-                        f"⚠️  LOCK LOOP DETECTED! ({LOCK_LOOP_THRESHOLD} locks in "
-                        f"{int(now - self.lock_history[0])}s) -> "
-                        f"PAUSING FOR {LOCK_LOOP_PENALTY}s"
-                    )
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-
-                    if self.flags.daemon_mode:
-                        if self.log_file:
-                            self.log_file.write(f"[{timestamp}] {msg}\n")
-                            self.log_file.flush()
-                    else:
-                        print(
-                            f"\n{Colors.RED}{Colors.BOLD}{msg}{Colors.RESET}\n"
-                        )
-
-                    if self.flags.file_logging and self.log_file:
-                        self.log_file.write(f"[{timestamp}] {msg}\n")
-                        self.log_file.flush()
-
-                    await asyncio.sleep(LOCK_LOOP_PENALTY)
-                    self.lock_history.clear()
-
-            # Retry logic for scanner reconnection
-            # Recreate scanner instance to ensure fresh connection
-            if self.flags.verbose:
-                print(
-                    f"{Colors.GREY}[Debug] Recreating BleakScanner instance...{Colors.RESET}"
-                )
-
-            self.scanner = BleakScanner(
-                detection_callback=self._detection_callback,
-                cb={"use_bdaddr": self.use_bdaddr},
-            )
+            if frozen:
+                # A stalled scanner usually starts again without delivering
+                # anything, so it is rebuilt rather than reused.
+                self.scanner = self._new_scanner()
+                self._reset_smoothing()
+            else:
+                await self._wait_for_unlock()
 
+            # Retry logic for scanner reconnection. After an unlock the
+            # existing scanner is reused; it is only recreated after a failed
+            # start, since every new instance allocates fresh CoreBluetooth
+            # resources.
             max_retries = 5
             retry_delay = 2
 
@@ -461,7 +641,7 @@ class DeviceMonitor:
                     if attempt >= max_retries - 1:
                         raise e
 
-                    timestamp = datetime.now().strftime("%H:%M:%S")
+                    timestamp = self._timestamp()
                     wait_time = retry_delay * (attempt + 1)
 
                     msg = (
@@ -470,45 +650,31 @@ class DeviceMonitor:
                         f"{wait_time}s... Error: {e}"
                     )
 
-                    if self.flags.daemon_mode:
-                        if self.log_file:
-                            self.log_file.write(f"{msg}\n")
-                            self.log_file.flush()
-                    elif self.flags.verbose:
-                        print(f"{Colors.YELLOW}{msg}{Colors.RESET}")
-
-                    if self.flags.file_logging and self.log_file:
-                        self.log_file.write(f"{msg}\n")
-                        self.log_file.flush()
+                    self._emit(
+                        msg, f"{Colors.YELLOW}{msg}{Colors.RESET}", flush=True
+                    )
 
                     await asyncio.sleep(wait_time)
 
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            if self.flags.daemon_mode:
-                msg = f"[{timestamp}] Scanner reconnected - Monitoring resumed"
-                if self.log_file:
-                    self.log_file.write(msg + "\n")
-                    self.log_file.flush()
-            elif self.flags.verbose:
-                print(
-                    f"{Colors.GREEN}[{timestamp}]{Colors.RESET} Scanner ready "
-                    f"→ Monitoring: {Colors.GREEN}{Colors.BOLD}Active{Colors.RESET}"
-                )
-
-            if self.flags.file_logging and self.log_file:
-                self.log_file.write(
-                    f"[{timestamp}] Scanner reconnected - Monitoring resumed\n"
-                )
-                self.log_file.flush()
+                    if self.flags.verbose:
+                        print(
+                            f"{Colors.GREY}[Debug] Recreating BleakScanner instance...{Colors.RESET}"
+                        )
+                    self.scanner = self._new_scanner()
+
+            timestamp = self._timestamp()
+            self._emit(
+                f"[{timestamp}] Scanner reconnected - Monitoring resumed",
+                f"{Colors.GREEN}[{timestamp}]{Colors.RESET} Scanner ready "
+                f"→ Monitoring: {Colors.GREEN}{Colors.BOLD}Active{Colors.RESET}",
+                flush=True,
+            )
 
-            # Set resume time for Grace Period logic
-            self.resume_time = time.monotonic()
+            self._start_grace_period()
+            self.last_packet_time = time.monotonic()
 
         except Exception as e:
-            import traceback
-
-            error_detail = traceback.format_exc()
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = self._timestamp()
 
             if self.flags.daemon_mode:
                 if self.log_file:
@@ -523,21 +689,220 @@ class DeviceMonitor:
                 )
 
             if self.flags.file_logging and self.log_file:
+                # Only format the traceback when it is actually written out
                 self.log_file.write(
                     f"[{timestamp}] ERROR: Scanner reconnection failed\n"
-                    f"{error_detail}\n"
+                    f"{traceback.format_exc()}\n"
                 )
                 self.log_file.flush()
         finally:
             self.is_handling_lock = False
             self.lock_handling_start_time = 0
 
+    async def _wait_for_unlock(self) -> None:
+        """Waits for the screen to unlock after the scanner was paused.
+
+        Logs the lock and unlock, clears the RSSI buffer and records the
+        lock event, pausing for LOCK_LOOP_PENALTY if a lock loop is found.
+        """
+        timestamp = self._timestamp()
+        self._emit(
+            f"[{timestamp}] Screen locked - Scanner paused",
+            f"{Colors.YELLOW}[{timestamp}]{Colors.RESET} Screen locked "
+            f"→ Scanner {Colors.BOLD}{Colors.YELLOW}Paused{Colors.RESET}"
+            f" │ Monitoring: Waiting for unlock",
+            flush=True,
+        )
+
+        await asyncio.sleep(2)
+
+        # The watchdog probes the lock state on every tick and sets
+        # _unlocked once the screen is unlocked; the timeout is only a
+        # fallback in case that wake-up is missed.
+        wait_start = time.monotonic()
+        self._unlocked.clear()
+        is_waiting = False
+        while self._is_screen_locked():
+            if not is_waiting:
+                timestamp = self._timestamp()
+                is_waiting = True
+                self._emit(
+                    f"[{timestamp}] "
+                    f"Screen still locked - Waiting for unlock",
+                    f"{Colors.GREY}[{timestamp}]{Colors.RESET} "
+                    f"Screen locked → Waiting...",
+                    flush=True,
+                )
+
+            try:
+                await asyncio.wait_for(
+                    self._unlocked.wait(),
+                    timeout=_UNLOCK_RECHECK_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._unlocked.clear()
+
+        # One clock read and timestamp serve the whole unlock phase,
+        # including the lock loop check below.
+        timestamp = self._timestamp()
+        unlocked_at = time.monotonic()
+        total_time = int(unlocked_at - wait_start)
+
+        self._reset_smoothing()
+
+        self._emit(
+            f"[{timestamp}] Screen unlocked - "
+            f"Reconnecting scanner (locked for {total_time}s)",
+            f"{Colors.GREEN}[{timestamp}]{Colors.RESET} Screen unlocked "
+            f"→ Reconnecting │ Locked: {total_time}s │ "
+            f"RSSI buffer: Cleared",
+            flush=True,
+        )
+
+        # --- Lock Loop Protection ---
+        loop_span = self._record_lock_event(unlocked_at)
+
+        if loop_span is not None:
+            msg = (
+                f"⚠️  LOCK LOOP DETECTED! ({LOCK_LOOP_THRESHOLD} locks in "
+                f"{int(loop_span)}s) -> "
+                f"PAUSING FOR {LOCK_LOOP_PENALTY}s"
+            )
+            self._emit(
+                f"[{timestamp}] {msg}",
+                f"\n{Colors.RED}{Colors.BOLD}{msg}{Colors.RESET}\n",
+                always=True,
+                flush=True,
+            )
+
+            await asyncio.sleep(LOCK_LOOP_PENALTY)
+            self._lock_history_count = 0
+
+    def _start_grace_period(self) -> None:
+        """Suppresses out-of-range alerts for GRACE_PERIOD_SECONDS.
+
+        A loop timer clears the flag, so the detection path only has to
+        test a boolean instead of reading the clock on every drain.
+        """
+        self.resume_time = time.monotonic()
+        self._in_grace = True
+        if self._grace_timer is not None:
+            self._grace_timer.cancel()
+        self._grace_timer = asyncio.get_running_loop().call_later(
+            GRACE_PERIOD_SECONDS, self._end_grace_period
+        )
+
+    def _end_grace_period(self) -> None:
+        """Re-enables out-of-range alerts once the grace period is over."""
+        self._in_grace = False
+        self._grace_timer = None
+
+    def _record_lock_event(self, now: float) -> Optional[float]:
+        """Records a lock event in the lock_history ring.
+
+        Args:
+            now: Monotonic timestamp of the event.
+
+        Returns:
+            The seconds spanned by the last LOCK_LOOP_THRESHOLD events if
+            they all fell within LOCK_LOOP_WINDOW, None otherwise.
+        """
+        idx = self._lock_history_idx
+        self.lock_history[idx] = now
+        # The next slot to overwrite holds the oldest recorded event.
+        idx = (idx + 1) % LOCK_LOOP_THRESHOLD
+        self._lock_history_idx = idx
+
+        if self._lock_history_count < LOCK_LOOP_THRESHOLD:
+            self._lock_history_count += 1
+            if self._lock_history_count < LOCK_LOOP_THRESHOLD:
+                return None
+
+        span = now - self.lock_history[idx]
+        return span if span < LOCK_LOOP_WINDOW else None
+
+    def _is_screen_locked(self) -> bool:
+        """Returns whether the screen is locked, reusing recent results.
+
+        Querying CoreGraphics allocates a full session dictionary, so the
+        answer is memoized for _LOCK_STATE_TTL_SECONDS; the watchdog and
+        the lock handler polling in the same window share one query.
+
+        Returns:
+            True if the screen is locked, False otherwise.
+        """
+        now = time.monotonic()
+        if now - self._lock_cache_ts >= _LOCK_STATE_TTL_SECONDS:
+            self._lock_cache_val = system.is_screen_locked()
+            self._lock_cache_ts = now
+        return self._lock_cache_val
+
+    def _timestamp(self) -> str:
+        """Returns the current wall-clock time formatted as ``%H:%M:%S``.
+
+        The formatted string is cached and only rebuilt when the second
+        changes, so bursts of advertisements share a single strftime call.
+
+        Returns:
+            The current time as an ``HH:MM:SS`` string.
+        """
+        now = int(time.time())
+        if now != self._cached_ts_sec:
+            self._cached_ts_sec = now
+            self._cached_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._cached_ts_str
+
+    def _reset_smoothing(self) -> None:
+        """Discards all smoothing state so estimates restart from new samples."""
+        self.rssi_buffer.clear()
+        self.ema_rssi = None
+        self.kalman_rssi = None
+
+    def _kalman_update(self, measurement: float) -> float:
+        """Folds a window median into the scalar Kalman estimate.
+
+        Args:
+            measurement: The median of the current RSSI window.
+
+        Returns:
+            The updated RSSI estimate.
+        """
+        if self.kalman_rssi is None:
+            self.kalman_rssi = measurement
+            self._kalman_variance = KALMAN_MEASUREMENT_NOISE
+            return measurement
+        predicted = self._kalman_variance + KALMAN_PROCESS_NOISE
+        gain = predicted / (predicted + KALMAN_MEASUREMENT_NOISE)
+        self.kalman_rssi += gain * (measurement - self.kalman_rssi)
+        self._kalman_variance = (1.0 - gain) * predicted
+        return self.kalman_rssi
+
+    def _add_sample(self, current_rssi: int) -> None:
+        """Folds a raw RSSI sample into the smoothing state.
+
+        Args:
+            current_rssi: The raw RSSI value to add.
+        """
+        if SMOOTHING_METHOD == "ema":
+            if self.ema_rssi is None:
+                self.ema_rssi = float(current_rssi)
+            else:
+                self.ema_rssi += EMA_ALPHA * (current_rssi - self.ema_rssi)
+        else:
+            self.rssi_buffer.append(current_rssi)
+
     def _process_signal(
         self,
         current_rssi: int,
     ) -> Tuple[Optional[float], Optional[float]]:
         """Updates the RSSI buffer and calculates the smoothed distance.
 
+        With the 'ema' smoothing method no buffer is kept: the new sample is
+        folded into a single exponential moving average, so a result is
+        available from the very first advertisement. With 'kalman' the
+        window median is filtered once per call.
+
         Args:
             current_rssi: The latest raw RSSI value received.
 
@@ -546,15 +911,38 @@ class DeviceMonitor:
                 - The smoothed RSSI value (float), or None if buffer is not full.
                 - The estimated distance (float), or None if buffer is not full.
         """
-        self.rssi_buffer.append(current_rssi)
+        self._add_sample(current_rssi)
+        if SMOOTHING_METHOD == "ema":
+            assert self.ema_rssi is not None
+            return self.ema_rssi, estimate_distance(self.ema_rssi)
+
         if len(self.rssi_buffer) < SAMPLE_WINDOW:
             return None, None
 
-        smoothed_rssi = smooth_rssi(self.rssi_buffer)
+        if SMOOTHING_METHOD == "mean":
+            # The buffer is full here, so the running sum gives the mean
+            # directly.
+            smoothed_rssi: Optional[float] = (
+                self.rssi_buffer.total / SAMPLE_WINDOW
+            )
+        else:
+            smoothed_rssi = smooth_rssi(self.rssi_buffer, "median")
         if smoothed_rssi is None:
             return None, None
-
-        distance_m = estimate_distance(smoothed_rssi)
+        if SMOOTHING_METHOD == "kalman":
+            # The filtered value is continuous, so skip the memo below.
+            smoothed_rssi = self._kalman_update(smoothed_rssi)
+            return smoothed_rssi, estimate_distance(smoothed_rssi)
+
+        # A full window's mean is a sum of integers over SAMPLE_WINDOW and a
+        # median is a whole or half dBm, so only a few hundred distinct
+        # values occur; memoize them exactly rather than binning.
+        distance_m = self._distance_cache.get(smoothed_rssi)
+        if distance_m is None:
+            distance_m = estimate_distance(smoothed_rssi)
+            if len(self._distance_cache) >= _DISTANCE_CACHE_SIZE:
+                self._distance_cache.clear()
+            self._distance_cache[smoothed_rssi] = distance_m
         return smoothed_rssi, distance_m
 
     def _log_status(
@@ -565,98 +953,89 @@ class DeviceMonitor:
     ) -> None:
         """Logs the current status to console and/or file.
 
+        A line is only emitted when the smoothed RSSI or the distance has
+        moved by at least LOG_RSSI_DELTA_DBM / LOG_DISTANCE_DELTA_M since
+        the last logged line, so steady RSSI-only updates stay quiet.
+
         Args:
             current_rssi: The latest raw RSSI value received.
             smoothed_rssi: The smoothed RSSI value.
             distance_m: The estimated distance in meters.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        if not self.flags.verbose and not self.flags.file_logging:
-            return
-
-        log_message = (
-            f"[{timestamp}] RSSI: {current_rssi:4d} dBm → "
-            f"Smoothed: {smoothed_rssi:5.1f} dBm │ "
-            f"Distance: {distance_m:5.2f}m"
+        # Work out where the line would go before formatting anything.
+        flags = self.flags
+        to_console = flags.verbose and not flags.daemon_mode
+        to_file = self.log_file is not None and (
+            flags.daemon_mode or flags.file_logging
         )
+        if not (to_console or to_file):
+            return
 
-        if self.flags.daemon_mode:
-            if self.log_file:
-                self.log_file.write(log_message + "\n")
-                self.log_file.flush()
-        else:
-            if self.flags.verbose:
-                signal_strength = (
-                    "Strong"
-                    if smoothed_rssi > -50
-                    else "Medium"
-                    if smoothed_rssi > -70
-                    else "Weak"
-                )
-                signal_color = (
-                    Colors.GREEN
-                    if smoothed_rssi > -50
-                    else Colors.YELLOW
-                    if smoothed_rssi > -70
-                    else Colors.RED
-                )
-                print(
-                    f"{Colors.BLUE}[{timestamp}]{Colors.RESET} "
-                    f"RSSI: {current_rssi:4d} dBm → "
-                    f"Smoothed: {smoothed_rssi:5.1f} dBm │ "
-                    f"Distance: {Colors.BOLD}{distance_m:5.2f}m{Colors.RESET} │ "
-                    f"Signal: {signal_color}{signal_strength}{Colors.RESET}"
-                )
-
-            if self.flags.file_logging and self.log_file:
-                self.log_file.write(log_message + "\n")
-                self.log_file.flush()
-
-    def _trigger_out_of_range_alert(self, distance_m: float) -> bool:
+        if (
+            abs(smoothed_rssi - self._last_logged_rssi) < LOG_RSSI_DELTA_DBM
+            and abs(distance_m - self._last_logged_dist) < LOG_DISTANCE_DELTA_M
+        ):
+            return
+        self._last_logged_rssi = smoothed_rssi
+        self._last_logged_dist = distance_m
+
+        fields = {
+            "ts": self._timestamp(),
+            "raw": current_rssi,
+            "sm": smoothed_rssi,
+            "d": distance_m,
+        }
+
+        if to_console:
+            fields["sc"], fields["sl"] = signal_strength(smoothed_rssi)
+            print(_STATUS_TEMPLATE_RICH.format_map(fields))
+
+        # Status lines stay in the file buffer; the watchdog flushes them
+        # every _LOG_FLUSH_INTERVAL_SECONDS.
+        if to_file:
+            assert self.log_file is not None
+            self.log_file.write(_STATUS_TEMPLATE.format_map(fields) + "\n")
+
+    async def _trigger_out_of_range_alert(self, distance_m: float) -> None:
         """Handles the out-of-range alert logic.
 
+        The banner is shown first, then the lock command runs in the default
+        executor so the detection callbacks keep being served while `pmset`
+        blocks, and its result is reported once it returns. The lock
+        handler is started once the MacBook reports locked.
+
         Args:
             distance_m: The estimated distance in meters.
-
-        Returns:
-            True if the MacBook was locked, False otherwise.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        success, lock_status = system.lock_macbook()
-        is_locked = success
+        timestamp = self._timestamp()
 
         alert_msg = (
             f"⚠️  ALERT: Device '{TARGET_DEVICE_NAME}' is far away! "
-            f"(~{distance_m:.2f} m) - {lock_status}"
+            f"(~{distance_m:.2f} m) - {_LOCKING_STATUS}"
         )
 
-        if self.flags.daemon_mode:
-            msg = f"[{timestamp}] {alert_msg}"
-            if self.log_file:
-                self.log_file.write(msg + "\n")
-                self.log_file.flush()
+        self._emit(
+            f"[{timestamp}] {alert_msg}",
+            _OUT_OF_RANGE_BANNER.format(
+                name=TARGET_DEVICE_NAME,
+                d=distance_m,
+                ts=timestamp,
+                status=_LOCKING_STATUS,
+            ),
+            always=True,
+            flush=True,
+        )
 
-        else:
-            print(
-                f"\n{Colors.RED}{'─' * 50}{Colors.RESET}\n"
-                f"{Colors.RED}⚠{Colors.RESET}  {Colors.BOLD}"
-                f"ALERT: Device moved out of range{Colors.RESET}\n"
-                f"   Device:    {TARGET_DEVICE_NAME}\n"
-                f"   Distance:  ~{distance_m:.2f}m "
-                f"(threshold: {DISTANCE_THRESHOLD_M}m)\n"
-                f"   Time:      {timestamp}\n"
-                f"   Action:    {lock_status}\n"
-                f"{Colors.RED}{'─' * 50}{Colors.RESET}\n"
-            )
-            # Write to log file if enabled
-            if self.flags.file_logging and self.log_file:
-                self.log_file.write(f"[{timestamp}] {alert_msg}\n")
-                self.log_file.flush()
+        loop = asyncio.get_running_loop()
+        success, lock_status = await loop.run_in_executor(
+            None, system.lock_macbook
+        )
+        self._emit(
+            f"[{self._timestamp()}] {lock_status}", always=True, flush=True
+        )
 
-        self.alert_triggered = True
-        return is_locked
+        if success:
+            self._lock_trigger.set()
 
     def _trigger_in_range_alert(self, distance_m: float) -> None:
         """Handles the back-in-range alert logic.
@@ -664,67 +1043,84 @@ class DeviceMonitor:
         Args:
             distance_m: The estimated distance in meters.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self._timestamp()
 
         back_msg_plain = (
             f"STATUS: Device '{TARGET_DEVICE_NAME}' is back in range. "
             f"(~{distance_m:.2f} m)"
         )
 
-        if self.flags.daemon_mode:
-            msg = f"[{timestamp}] {back_msg_plain}"
-            if self.log_file:
-                self.log_file.write(msg + "\n")
-                self.log_file.flush()
+        self._emit(
+            f"[{timestamp}] {back_msg_plain}",
+            _BACK_IN_RANGE_BANNER.format(
+                name=TARGET_DEVICE_NAME, d=distance_m, ts=timestamp
+            ),
+            always=True,
+            flush=True,
+        )
+        self.alert_triggered = False
 
-        else:
-            back_msg_rich = (
-                f"\n{Colors.GREEN}{'─' * 60}{Colors.RESET}\n"
-                f"{Colors.GREEN}✓{Colors.RESET}  {Colors.BOLD}"
-                f"Device Back in Range{Colors.RESET}\n"
-                f"   Device:    {TARGET_DEVICE_NAME}\n"
-                f"   Distance:  ~{distance_m:.2f}m "
-                f"(Threshold: {DISTANCE_THRESHOLD_M}m)\n"
-                f"   Time:      {timestamp}\n"
-                f"   Status:    🔓 Ready to unlock MacBook\n"
-                f"{Colors.GREEN}{'─' * 60}{Colors.RESET}\n"
-            )
-            print(back_msg_rich)
+    def _emit(
+        self,
+        plain: str,
+        rich: Optional[str] = None,
+        *,
+        always: bool = False,
+        flush: bool = False,
+    ) -> None:
+        """Routes one message to the terminal and/or the log file.
 
-            if self.flags.file_logging and self.log_file:
-                self.log_file.write(f"[{timestamp}] {back_msg_plain}\n")
+        In daemon mode stdout is /dev/null, so only ``plain`` is written to
+        the log file. Otherwise ``rich`` (or ``plain``) is printed when
+        verbose output is on, and ``plain`` is appended to the log file
+        when file logging is enabled.
+
+        Args:
+            plain: The uncolored line written to the log file.
+            rich: An optional colored variant printed to the terminal.
+            always: Print to the terminal even without verbose output.
+            flush: Flush the log file now instead of on the watchdog's
+                next periodic flush.
+        """
+        if not self.flags.daemon_mode:
+            if always or self.flags.verbose:
+                print(plain if rich is None else rich)
+            if not self.flags.file_logging:
+                return
+        if self.log_file:
+            self.log_file.write(plain + "\n")
+            if flush:
                 self.log_file.flush()
-        self.alert_triggered = False
 
     def _handle_bleak_error(self, exc: Optional[Exception] = None) -> None:
         """Handles the specific AttributeError for malformed BLE packets.
 
         Catches the ``NoneType has no attribute 'hex'`` error that occurs
-        when the host Mac is locked or sleeping.
+        when the host Mac is locked or sleeping. At most one report is
+        written every _BLEAK_ERROR_REPORT_INTERVAL seconds.
 
         Args:
             exc: The caught exception, if any.
         """
+        now = time.monotonic()
+        if now - self._last_bleak_error_ts < _BLEAK_ERROR_REPORT_INTERVAL:
+            return
+        self._last_bleak_error_ts = now
+
         if self.flags.daemon_mode:
             # In daemon mode, stdout is /dev/null. Write to log file.
             if self.log_file:
-                timestamp = datetime.now().strftime("%H:%M:%S")
+                timestamp = self._timestamp()
                 self.log_file.write(
                     f"[{timestamp}] DEBUG: Malformed packet ignored"
                     f"{f' ({exc})' if exc else ''}\n"
                 )
                 self.log_file.flush()
         elif self.flags.verbose:
-            print(
-                f"\n{Colors.YELLOW}{'─' * 60}{Colors.RESET}\n{Colors.YELLOW}"
-                f"DEBUG: Malformed Packet Ignored{Colors.RESET}\n{Colors.GREY}   "
-                f"└─> Cause: This is expected when the host Mac is locked or "
-                f"sleeping.{Colors.RESET}\n{Colors.YELLOW}{'─' * 60}"
-                f"{Colors.RESET}\n"
-            )
+            print(_MALFORMED_PACKET_BANNER)
 
     def _handle_generic_error(self, e: Exception) -> None:
-        """Handles unexpected exceptions in the detection callback.
+        """Handles unexpected exceptions in the detection path.
 
         Catches any unhandled errors so the scanner remains alive and
         operational.
@@ -735,23 +1131,19 @@ class DeviceMonitor:
         if self.flags.daemon_mode:
             # In daemon mode, stdout is /dev/null. Write to log file.
             if self.log_file:
-                timestamp = datetime.now().strftime("%H:%M:%S")
+                timestamp = self._timestamp()
                 self.log_file.write(f"[{timestamp}] CALLBACK ERROR: {e}\n")
                 self.log_file.flush()
         elif self.flags.verbose:
-            print(
-                f"\n{Colors.RED}{'─' * 60}{Colors.RESET}\n{Colors.RED}CRITICAL: "
-                f"Unexpected Callback Error{Colors.RESET}\n{Colors.GREY}   "
-                f"An error was caught, but the scanner will continue to run."
-                f"{Colors.RESET}\n   └─> {Colors.BOLD}Error Details:"
-                f"{Colors.RESET} {e}\n{Colors.RED}{'─' * 60}{Colors.RESET}\n"
-            )
+            print(f"{_CALLBACK_ERROR_HEAD}{e}\n{_BAR_RED_60}\n")
 
     def _setup_logging(self) -> None:
         """Sets up file logging if enabled in the flags."""
         if self.flags.file_logging:
             try:
-                self.log_file = open(LOG_FILE, "a")
+                self.log_file = open(
+                    LOG_FILE, "a", buffering=8192, encoding="utf-8"
+                )
             except IOError as e:
                 print(
                     f"{Colors.YELLOW}Warning:{Colors.RESET} "
@@ -759,13 +1151,45 @@ class DeviceMonitor:
                 )
                 self.flags.file_logging = False
 
-    async def run(self) -> None:
-        """Starts the monitoring session."""
+    def _prepare_lock(self) -> None:
+        """Applies the password-on-wake policy before monitoring starts.
+
+        Doing it up front means an alert only has to put the display to
+        sleep. On failure a warning is reported and lock_macbook() retries.
+        """
+        try:
+            system.prepare_lock()
+        except (subprocess.CalledProcessError, OSError) as e:
+            self._emit(
+                f"[{self._timestamp()}] Warning: Could not apply the "
+                f"password-on-wake policy: {e}",
+                f"{Colors.YELLOW}Warning:{Colors.RESET} "
+                f"Could not apply the password-on-wake policy: {e}",
+                always=True,
+            )
+
+    async def run(self, on_ready: Optional[Callable[[], None]] = None) -> None:
+        """Starts the monitoring session.
+
+        Args:
+            on_ready: Called once the scanner has started, e.g. to tell the
+                process that spawned the daemon that it is up.
+        """
         self._setup_logging()
+        self._prepare_lock()
         self._print_start_status()
 
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGTERM, self._stop_event.set)
+            handles_sigterm = True
+        except (NotImplementedError, RuntimeError):
+            # Signal handlers are unavailable; SIGTERM kills outright.
+            handles_sigterm = False
+
         try:
             await self.scanner.start()
+            self.last_packet_time = time.monotonic()
 
             if self.flags.daemon_mode:
                 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -773,11 +1197,13 @@ class DeviceMonitor:
                 if self.log_file:
                     self.log_file.write(msg + "\n")
                     self.log_file.flush()
+            if on_ready is not None:
+                on_ready()
 
+            self._start_lock_worker()
             asyncio.create_task(self._watchdog_loop())
 
-            while True:
-                await asyncio.sleep(1.0)
+            await self._stop_event.wait()
         except Exception as e:
             # Handle scanner start failure
             if self.flags.daemon_mode:
@@ -798,11 +1224,17 @@ class DeviceMonitor:
                 )
         finally:
             # Graceful shutdown
+            if handles_sigterm:
+                loop.remove_signal_handler(signal.SIGTERM)
             if self.flags.verbose and not self.flags.daemon_mode:
                 print(f"\n{Colors.YELLOW}Stopping scanner...{Colors.RESET}")
 
             await self.scanner.stop()
 
+            # Let a lock in progress finish before its output goes away.
+            if self._alert_task is not None:
+                await self._alert_task
+
             if self.log_file:
                 self.log_file.close()
 
@@ -811,6 +1243,10 @@ class DeviceMonitor:
                     f"{Colors.GREEN}✓{Colors.RESET} {__app_name__} stopped.\n"
                 )
 
+    def stop(self) -> None:
+        """Asks a running monitoring session to shut down gracefully."""
+        self._stop_event.set()
+
     async def _check_pause_state(self, current_time: float) -> bool:
         """Checks if the monitor should be paused and handles the pause state.
 
@@ -821,9 +1257,6 @@ class DeviceMonitor:
             True if the monitor is currently paused (and watchdog should skip checks),
             False otherwise.
         """
-        if not os.path.exists(PAUSE_FILE):
-            return False
-
         try:
             with open(PAUSE_FILE, "r") as f:
                 pause_resume_time = float(f.read().strip())
@@ -836,7 +1269,7 @@ class DeviceMonitor:
                         await asyncio.wait_for(self.scanner.stop(), timeout=5.0)
                     except Exception:
                         pass
-                    timestamp = datetime.now().strftime("%H:%M:%S")
+                    timestamp = self._timestamp()
                     msg = f"[{timestamp}] Monitor paused until {datetime.fromtimestamp(pause_resume_time).strftime('%Y-%m-%d %H:%M:%S')} - Scanner stopped"
                     if self.flags.daemon_mode and self.log_file:
                         self.log_file.write(msg + "\n")
@@ -850,23 +1283,22 @@ class DeviceMonitor:
                 return True
             else:
                 # Pause expired
-                os.remove(PAUSE_FILE)
+                remove_file(PAUSE_FILE)
                 if self.is_paused:
                     self.is_paused = False
                     # Restart scanner logic:
-                    self.rssi_buffer.clear()
-                    self.scanner = BleakScanner(
-                        detection_callback=self._detection_callback,
-                        cb={"use_bdaddr": self.use_bdaddr},
-                    )
+                    self._reset_smoothing()
                     await self.scanner.start()
-                    timestamp = datetime.now().strftime("%H:%M:%S")
+                    timestamp = self._timestamp()
                     msg = f"[{timestamp}] Pause expired - Scanner resumed"
                     if self.flags.daemon_mode and self.log_file:
                         self.log_file.write(msg + "\n")
                         self.log_file.flush()
                     elif self.flags.verbose:
                         print(f"{Colors.GREEN}{msg}{Colors.RESET}")
+        except FileNotFoundError:
+            # Not paused
+            pass
         except (IOError, ValueError):
             # Invalid file, ignore and remove
             try:
@@ -876,6 +1308,28 @@ class DeviceMonitor:
 
         return False
 
+    def _next_watchdog_interval(self, is_locked: bool) -> float:
+        """Computes how long the watchdog sleeps before its next tick.
+
+        Args:
+            is_locked: Whether the screen was locked on this tick.
+
+        Returns:
+            The next tick interval in seconds.
+        """
+        if (
+            not is_locked
+            and not self.is_handling_lock
+            and time.monotonic() - self.last_packet_time < 30
+        ):
+            self._watchdog_interval = min(
+                self._watchdog_interval * _WATCHDOG_BACKOFF,
+                _WATCHDOG_MAX_INTERVAL,
+            )
+        else:
+            self._watchdog_interval = _WATCHDOG_MIN_INTERVAL
+        return self._watchdog_interval
+
     async def _watchdog_loop(self) -> None:
         """Background task to monitor for external screen lock events.
 
@@ -890,6 +1344,14 @@ class DeviceMonitor:
             try:
                 current_time = time.monotonic()
 
+                if (
+                    self.log_file
+                    and current_time - self._last_flush
+                    > _LOG_FLUSH_INTERVAL_SECONDS
+                ):
+                    self.log_file.flush()
+                    self._last_flush = current_time
+
                 # --- Pause logic execution ---
                 if await self._check_pause_state(current_time):
                     continue
@@ -900,7 +1362,7 @@ class DeviceMonitor:
                     time_since_packet = int(
                         current_time - self.last_packet_time
                     )
-                    timestamp = datetime.now().strftime("%H:%M:%S")
+                    timestamp = self._timestamp()
 
                     if self.flags.daemon_mode:
                         msg = (
@@ -919,16 +1381,20 @@ class DeviceMonitor:
                         )
                     last_log_time = current_time
 
-                if system.is_screen_locked() and not self.is_handling_lock:
-                    # Spawn handler as a task so watchdog keeps running
-                    asyncio.create_task(self._handle_screen_lock())
+                is_locked = self._is_screen_locked()
+                if is_locked and not self.is_handling_lock:
+                    # Wake the lock worker so the watchdog keeps running
+                    self._lock_trigger.set()
+                elif not is_locked and self.is_handling_lock:
+                    # Wake a lock handler waiting for the unlock
+                    self._unlocked.set()
 
                 # Heartbeat check: Restart scanner if no packets received for 120s
                 if (
                     current_time - self.last_packet_time > 120
                     and not self.is_handling_lock
                 ):
-                    timestamp = datetime.now().strftime("%H:%M:%S")
+                    timestamp = self._timestamp()
                     msg = "Watchdog: Scanner frozen (no data for 120s) -> Restarting..."
                     if self.flags.daemon_mode:
                         if self.log_file:
@@ -936,13 +1402,14 @@ class DeviceMonitor:
                             self.log_file.flush()
                     elif self.flags.verbose:
                         print(f"{Colors.YELLOW}{msg}{Colors.RESET}")
-                    # Spawn handler as a task
-                    asyncio.create_task(self._handle_screen_lock())
+                    # Wake the lock worker to restart the scanner
+                    self._scanner_frozen = True
+                    self._lock_trigger.set()
 
                 # Stuck handler check: If handling lock takes > 60s, force reset
                 if self.is_handling_lock and self.lock_handling_start_time > 0:
                     if current_time - self.lock_handling_start_time > 60:
-                        timestamp = datetime.now().strftime("%H:%M:%S")
+                        timestamp = self._timestamp()
                         msg = "Watchdog: Lock handler stuck for >60s -> Forcing reset"
                         if self.flags.daemon_mode:
                             if self.log_file:
@@ -950,17 +1417,19 @@ class DeviceMonitor:
                                 self.log_file.flush()
                         elif self.flags.verbose:
                             print(f"{Colors.RED}{msg}{Colors.RESET}")
+                        # Cancel the stuck handler and start a fresh worker.
+                        # We don't trigger it immediately to avoid a
+                        # recursion loop. The next watchdog tick will
+                        # trigger it if needed (via heartbeat or lock check)
+                        self._start_lock_worker()
                         self.is_handling_lock = False
                         self.lock_handling_start_time = 0
-                        # We don't call _handle_screen_lock immediately
-                        # to avoid recursion loop. The next watchdog tick will
-                        # trigger it if needed (via heartbeat or lock check)
 
-                await asyncio.sleep(2.0)
+                await asyncio.sleep(self._next_watchdog_interval(is_locked))
             except Exception as e:
                 if self.flags.daemon_mode:
                     if self.log_file:
-                        timestamp = datetime.now().strftime("%H:%M:%S")
+                        timestamp = self._timestamp()
                         self.log_file.write(
                             f"[{timestamp}] Watchdog error: {e}\n"
                         )
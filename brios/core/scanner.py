@@ -1,12 +1,39 @@
-from typing import List
+import sys
+import asyncio
+from typing import Dict, List, Tuple
 
 from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 
-from .utils import Colors, __app_name__, estimate_distance
+from .utils import Colors, __app_name__, estimate_distance, signal_color
 from .config import TX_POWER_AT_1M, PATH_LOSS_EXPONENT
 
+# Width of the name column in the results table.
+_NAME_WIDTH = 30
+
+# Placeholder for unnamed devices, padded by hand because the color codes
+# would throw off a format-spec width.
+_UNKNOWN_NAME = (
+    f"{Colors.YELLOW}(Unknown){Colors.RESET}"
+    f"{' ' * (_NAME_WIDTH - len('(Unknown)'))}"
+)
+
+# Rule drawn under the scan headers and above the results table.
+_SEP_70 = "─" * 70
+
+# One row of the results table, filled with str.format() per device. The
+# name arrives already padded (and colored, for unknown devices).
+_ROW_TEMPLATE = (
+    "{i:2d}. {name} │ {address} │ "
+    f"{{color}}{{rssi:4d}} dBm{Colors.RESET} │ ~{{distance:5.2f}}m"
+)
+
+# Printed as soon as a device is first heard, before the final table.
+_FOUND_TEMPLATE = (
+    f"{Colors.GREY}  + {{address}}  {{rssi:4d}} dBm  {{name}}{Colors.RESET}"
+)
+
 
 class DeviceScanner:
     """Performs a one-time BLE device discovery scan.
@@ -32,32 +59,52 @@ class DeviceScanner:
         self.duration = duration
         self.use_bdaddr = use_bdaddr
         self.verbose = verbose
+        # Latest (device, adv_data) per address, as discover() would return.
+        self._seen: Dict[str, Tuple[BLEDevice, AdvertisementData]] = {}
 
     async def run(self) -> None:
-        """Executes the device scan and prints formatted results."""
+        """Executes the device scan and prints formatted results.
+
+        Each device is announced as soon as it is first heard; the full,
+        sorted table follows once the scan duration has elapsed.
+        """
         self._print_summary()
 
-        # Pass cb parameter directly to satisfy mypy type checking
-        devices_and_adv = await BleakScanner.discover(
-            timeout=float(self.duration),
-            return_adv=True,
+        self._seen.clear()
+        async with BleakScanner(
+            detection_callback=self._on_advertisement,
             cb={"use_bdaddr": self.use_bdaddr},
-        )
+        ):
+            await asyncio.sleep(self.duration)
 
-        devices = sorted(
-            [
-                (device, adv_data)
-                for _, (device, adv_data) in devices_and_adv.items()
-            ],
-            key=lambda x: getattr(x[0], "address", str(x[0])),
-        )
+        devices = sorted(self._seen.values(), key=lambda pair: pair[0].address)
 
         self._print_results(devices)
 
+    def _on_advertisement(
+        self, device: BLEDevice, adv_data: AdvertisementData
+    ) -> None:
+        """Records an advertisement, announcing first-time devices.
+
+        Args:
+            device: The BLEDevice that sent the advertisement.
+            adv_data: The advertisement data, including its RSSI.
+        """
+        is_new = device.address not in self._seen
+        self._seen[device.address] = (device, adv_data)
+        if is_new:
+            print(
+                _FOUND_TEMPLATE.format(
+                    address=device.address,
+                    rssi=adv_data.rssi,
+                    name=device.name or "(Unknown)",
+                )
+            )
+
     def _print_summary(self) -> None:
         """Prints a summary of the scanner configuration."""
         print(f"\n{Colors.BOLD}{__app_name__} Device Scanner{Colors.RESET}")
-        print("─" * 70)
+        print(_SEP_70)
         print(f"Duration:   {self.duration} seconds")
 
         mode = (
@@ -72,7 +119,7 @@ class DeviceScanner:
             f"TX Power:   {TX_POWER_AT_1M} dBm @ 1m (for distance calculation)"
         )
         print(f"Path Loss:  {PATH_LOSS_EXPONENT} (environmental factor)")
-        print("─" * 70)
+        print(_SEP_70)
         print(f"\n{Colors.GREEN}●{Colors.RESET} Scanning...\n")
 
     def _print_results(
@@ -85,43 +132,42 @@ class DeviceScanner:
             devices: A list of tuples containing BLEDevice instances and their
                 corresponding AdvertisementData.
         """
-        print(
+        lines = [
             f"\n{Colors.BOLD}Scan Results{Colors.RESET} ({len(devices)} "
-            f"device{'s' if len(devices) != 1 else ''} found)"
-        )
-        print("─" * 70)
+            f"device{'s' if len(devices) != 1 else ''} found)",
+            _SEP_70,
+        ]
 
         if not devices:
-            print(f"{Colors.YELLOW}No devices found{Colors.RESET}")
-            return
+            lines.append(f"{Colors.YELLOW}No devices found{Colors.RESET}")
 
+        # BLEDevice always has address and name (name may be None) and
+        # AdvertisementData always has rssi, so no hasattr() guards.
         for i, (device, adv_data) in enumerate(devices, 1):
-            address = (
-                device.address if hasattr(device, "address") else str(device)
-            )
-            device_name = device.name if hasattr(device, "name") else None
+            address = device.address
+            device_name = device.name
+            # Let the formatter pad the name column.
             name_display = (
-                device_name
+                f"{device_name:<{_NAME_WIDTH}}"
                 if device_name
-                else f"{Colors.YELLOW}(Unknown){Colors.RESET}"
+                else _UNKNOWN_NAME
             )
 
-            # Ensure proper alignment
-            visible_length = len(device_name) if device_name else 9
-            padding = 30 - visible_length
-
             # Get RSSI and calculate distance
-            rssi = adv_data.rssi if hasattr(adv_data, "rssi") else -100
+            rssi = adv_data.rssi
             distance = estimate_distance(rssi)
-            signal_color = (
-                Colors.GREEN
-                if rssi > -50
-                else Colors.YELLOW
-                if rssi > -70
-                else Colors.RED
+            lines.append(
+                _ROW_TEMPLATE.format(
+                    i=i,
+                    name=name_display,
+                    address=address,
+                    color=signal_color(rssi),
+                    rssi=rssi,
+                    distance=distance,
+                )
             )
 
-            print(
-                f"{i:2d}. {name_display}{' ' * padding} │ {address} │ "
-                f"{signal_color}{rssi:4d} dBm{Colors.RESET} │ ~{distance:5.2f}m"
-            )
+        # Emit the whole block with a single write instead of one print()
+        # per device.
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
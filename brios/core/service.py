@@ -1,13 +1,26 @@
 import os
 import sys
 import time
+import select
 import shutil
-import signal
 import argparse
 import subprocess
 from typing import Optional, Tuple, List
 
-from .utils import PID_FILE, LOG_FILE, PAUSE_FILE, Colors, Flags, __app_name__, determine_target_address
+from .utils import (
+    PID_FILE,
+    LOG_FILE,
+    PAUSE_FILE,
+    Colors,
+    Flags,
+    __app_name__,
+    determine_target_address,
+    format_elapsed,
+    read_pid_file,
+    remove_file,
+    tail_lines,
+)
+from .system import is_python_process, process_uptime, terminate_process
 from .config import (
     TARGET_DEVICE_NAME,
     TARGET_DEVICE_MAC_ADDRESS,
@@ -18,6 +31,151 @@ from .config import (
     PATH_LOSS_EXPONENT,
 )
 
+# Operating mode options forwarded to the daemon, as (attribute, flag).
+# The modes are mutually exclusive, so the first one set wins.
+_MODE_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("target_mac", "--target-mac"),
+    ("target_uuid", "--target-uuid"),
+    ("scanner", "--scanner"),
+)
+
+# Boolean options forwarded to the daemon, as (attribute, flag).
+_FORWARDED_FLAGS: Tuple[Tuple[str, str], ...] = (("macos_use_bdaddr", "-m"),)
+
+# Longest time start() waits for a new daemon to report that its scanner
+# is up. Powering on the Bluetooth stack can take a moment, so this is
+# generous; a daemon that fails exits and ends the wait early.
+_START_TIMEOUT_SECONDS = 5.0
+
+# Environment variable carrying the write end of the pipe a new daemon
+# signals once its scanner has started (see notify_daemon_ready).
+DAEMON_READY_FD_ENV = "BRIOS_READY_FD"
+
+# Options every daemon runs with: its stdout/stderr are redirected to the
+# log file and no terminal is available, so file logging and verbose mode
+# are always on. '--daemon' is the internal signal for the new process to
+# run in daemon mode.
+DAEMON_OPTIONS = ("-f", "-v", "--daemon")
+
+# How long stop() waits for the daemon to exit after SIGTERM.
+_STOP_TIMEOUT_SECONDS = 5.0
+
+# Static fragments of the status printouts, rendered once at import.
+_SEPARATOR = "─" * 50
+_RUNNING_LINE = f"Status:     {Colors.GREEN}● RUNNING{Colors.RESET}"
+_STOPPED_LINE = f"Status:     {Colors.RED}● STOPPED{Colors.RESET}"
+_STATUS_HEADER = f"\n{Colors.BOLD}{__app_name__} Monitor Status{Colors.RESET}"
+_START_HEADER = (
+    f"\n{Colors.BOLD}Starting {__app_name__} Background Monitor{Colors.RESET}"
+)
+_STARTED_LINE = (
+    f"{Colors.GREEN}✓{Colors.RESET} {__app_name__} started successfully"
+)
+_START_FAILED_LINE = (
+    f"{Colors.RED}✗{Colors.RESET} Failed to start {__app_name__}"
+)
+_STILL_STARTING_LINE = (
+    f"{Colors.YELLOW}!{Colors.RESET} {__app_name__} is still starting"
+)
+_RUNNING_IN_BACKGROUND = (
+    f"\n{Colors.GREEN}●{Colors.RESET} {__app_name__} running in background"
+)
+_UPDATE_NOTICE = (
+    f"\n{Colors.YELLOW}⚠ Update available: v{{version}}"
+    f" — run 'brios --update' to upgrade{Colors.RESET}"
+)
+
+
+def _spawn_daemon(
+    command: List[str], stderr_fd: int, ready_fd: Optional[int] = None
+) -> int:
+    """Launches the daemon in a new session, detached from the terminal.
+
+    Uses os.posix_spawn where the platform supports it, which skips the
+    Python-level fork/exec plumbing of subprocess. Falls back to
+    subprocess.Popen otherwise.
+
+    Args:
+        command: The daemon command line; the first item must be a path.
+        stderr_fd: The file descriptor that receives the daemon's stderr.
+        ready_fd: An optional pipe write end the daemon inherits and signals
+            once it is up (see notify_daemon_ready).
+
+    Returns:
+        The PID of the spawned process.
+    """
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    pass_fds: Tuple[int, ...] = ()
+    if ready_fd is not None:
+        env[DAEMON_READY_FD_ENV] = str(ready_fd)
+        pass_fds = (ready_fd,)
+        # posix_spawn keeps every inheritable descriptor open in the child.
+        os.set_inheritable(ready_fd, True)
+    if hasattr(os, "posix_spawn"):
+        try:
+            return os.posix_spawn(
+                command[0],
+                command,
+                env,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_DUP2, stderr_fd, 2),
+                ],
+                setsid=True,
+            )
+        except NotImplementedError:
+            pass  # No POSIX_SPAWN_SETSID on this platform.
+
+    return subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=stderr_fd,
+        start_new_session=True,
+        env=env,
+        pass_fds=pass_fds,
+    ).pid
+
+
+def _wait_for_daemon(
+    ready_fd: int, timeout: float = _START_TIMEOUT_SECONDS
+) -> Optional[bool]:
+    """Waits until a freshly spawned daemon has started its scanner.
+
+    The daemon writes a byte to the pipe once its scanner is running. If
+    it exits first, e.g. because Bluetooth is off, its end of the pipe
+    closes and the read returns EOF, so either way this wakes up at once.
+
+    Args:
+        ready_fd: The read end of the pipe passed to _spawn_daemon.
+        timeout: The maximum time to wait, in seconds.
+
+    Returns:
+        True if the daemon signalled, False if it exited without doing so,
+        or None if it did neither within the timeout.
+    """
+    readable, _, _ = select.select([ready_fd], [], [], timeout)
+    if not readable:
+        return None
+    return os.read(ready_fd, 1) == b"1"
+
+
+def notify_daemon_ready() -> None:
+    """Tells the ``--start`` process that spawned this daemon that it is up.
+
+    Writes one byte to the pipe named by DAEMON_READY_FD_ENV and closes it.
+    Does nothing when the process was not started by ServiceManager.start.
+    """
+    fd = os.environ.pop(DAEMON_READY_FD_ENV, None)
+    if fd is None:
+        return
+    try:
+        os.write(int(fd), b"1")
+        os.close(int(fd))
+    except (OSError, ValueError):
+        pass  # The parent gave up waiting; nothing to report to.
+
 
 class ServiceManager:
     """Handles the application's lifecycle as a background service (daemon).
@@ -28,6 +186,8 @@ class ServiceManager:
 
     Attributes:
         args: The command-line arguments parsed into a Namespace object.
+        _pid_cache: The PID file's mtime (ns) and the (pid, is_running)
+            result read at that mtime, or None if it must be recomputed.
     """
 
     def __init__(self, args: argparse.Namespace) -> None:
@@ -37,35 +197,54 @@ class ServiceManager:
             args: The parsed command-line arguments.
         """
         self.args = args
+        self._pid_cache: Optional[Tuple[int, Tuple[Optional[int], bool]]] = None
 
     def _get_pid_status(self) -> Tuple[Optional[int], bool]:
-        """Checks for the PID file and determines if the process is running.
+        """Returns the daemon's (pid, is_running) status.
 
-        Reads the PID from the PID file and checks if a process with that PID
-        is currently active.
+        The result is cached against the PID file's modification time, so
+        repeated checks (e.g. ``start`` followed by ``_print_start_status``)
+        cost a single ``stat`` instead of a read plus a ``kill`` probe.  A
+        rewritten PID file is picked up automatically; call
+        ``_invalidate_pid_cache`` when the process may have exited without
+        the file changing.
 
         Returns:
             A tuple containing (pid, is_running). The pid is None if the file
             does not exist.
         """
-        if not os.path.exists(PID_FILE):
-            return None, False
         try:
-            with open(PID_FILE, "r") as f:
-                pid = int(f.read().strip())
-
-        except (IOError, ValueError):
-            # The PID file is corrupt or unreadable.
+            mtime_ns = os.stat(PID_FILE).st_mtime_ns
+        except OSError:
+            self._pid_cache = None
             return None, False
 
+        if self._pid_cache is None or self._pid_cache[0] != mtime_ns:
+            self._pid_cache = (mtime_ns, self._read_pid_status())
+        return self._pid_cache[1]
+
+    def _invalidate_pid_cache(self) -> None:
+        """Forgets the cached PID status so the next check re-reads it."""
+        self._pid_cache = None
+
+    def _read_pid_status(self) -> Tuple[Optional[int], bool]:
+        """Checks for the PID file and determines if the process is running.
+
+        Reads the PID from the PID file and checks that a Python process with
+        that PID is currently active, so a reused PID is not mistaken for
+        the daemon.
+
+        Returns:
+            A tuple containing (pid, is_running). The pid is None if the file
+            does not exist.
+        """
         try:
-            # A signal of 0 tests for the existence of the process without
-            # affecting it.
-            os.kill(pid, 0)
-            return pid, True
-        except OSError:
-            # The process does not exist.
-            return pid, False
+            pid = read_pid_file(PID_FILE)
+        except (OSError, ValueError):
+            # The PID file is missing, corrupt or unreadable.
+            return None, False
+
+        return pid, is_python_process(pid)
 
     def _reconstruct_command(self) -> List[str]:
         """Reconstructs the original command to relaunch the script as a daemon.
@@ -85,30 +264,16 @@ class ServiceManager:
             # Fallback to python + script path
             command = [sys.executable, os.path.abspath(sys.argv[0])]
 
-        if self.args.target_mac:
-            command.extend(["--target-mac", self.args.target_mac])
-        elif self.args.target_uuid:
-            command.extend(["--target-uuid", self.args.target_uuid])
-        elif self.args.scanner is not None:
-            command.extend(["--scanner", str(self.args.scanner)])
+        for attr, flag in _MODE_OPTIONS:
+            value = getattr(self.args, attr)
+            if value is not None and value != "":
+                command += (flag, str(value))
+                break
 
-        if self.args.macos_use_bdaddr:
-            command.append("-m")
-
-        if self.args.verbose:
-            command.append("-v")
-
-        # Always enable file logging and verbose mode for the daemon,
-        # since its stdout/stderr are redirected to the log file and
-        # the terminal is not available.
-        if "-f" not in command:
-            command.append("-f")
-        if "-v" not in command:
-            command.append("-v")
-
-        # The '--daemon' flag is an internal signal for the new process to
-        # run in daemon mode.
-        command.append("--daemon")
+        command += [
+            flag for attr, flag in _FORWARDED_FLAGS if getattr(self.args, attr)
+        ]
+        command += DAEMON_OPTIONS
         return command
 
     def start(self, *, update_available: Optional[str] = None) -> None:
@@ -129,14 +294,13 @@ class ServiceManager:
         command = self._reconstruct_command()
         target_address = determine_target_address(self.args)
 
-        print(
-            f"\n{Colors.BOLD}Starting {__app_name__} Background Monitor{Colors.RESET}"
-        )
-        print("─" * 50)
-
+        header = [_START_HEADER, _SEPARATOR]
         if self.args.verbose:
-            print(f"{Colors.BLUE}Command:{Colors.RESET} {' '.join(command)}")
-            print("─" * 50)
+            header.append(
+                f"{Colors.BLUE}Command:{Colors.RESET} {' '.join(command)}"
+            )
+            header.append(_SEPARATOR)
+        print("\n".join(header), flush=True)
 
         try:
             # Redirect stdout to /dev/null (daemon has no terminal).
@@ -145,27 +309,26 @@ class ServiceManager:
             # instead of being silently lost.
             log_dir = os.path.dirname(LOG_FILE)
             os.makedirs(log_dir, exist_ok=True)
-            stderr_log = open(LOG_FILE, "a")
-            subprocess.Popen(
-                command,
-                stdout=subprocess.DEVNULL,
-                stderr=stderr_log,
-                start_new_session=True,
-                env={**os.environ, "PYTHONUNBUFFERED": "1"},
-            )
-            stderr_log.close()
-
-            # Wait for the process to start, write PID, and begin scanning.
-            # A longer wait catches daemons that crash during initialization.
-            time.sleep(1.5)
-            pid, _ = self._get_pid_status()
+            read_fd, write_fd = os.pipe()
+            try:
+                try:
+                    with open(LOG_FILE, "a") as stderr_log:
+                        _spawn_daemon(command, stderr_log.fileno(), write_fd)
+                finally:
+                    # Only the daemon may hold the write end, so the wait
+                    # sees EOF if it exits before signalling.
+                    os.close(write_fd)
+                ready = _wait_for_daemon(read_fd)
+            finally:
+                os.close(read_fd)
+            self._invalidate_pid_cache()
         except Exception as e:
             print(
                 f"{Colors.RED}Error starting background process: {e}{Colors.RESET}"
             )
             return
         self._print_start_status(
-            target_address, update_available=update_available
+            target_address, ready=ready, update_available=update_available
         )
 
     def stop(self) -> None:
@@ -176,39 +339,43 @@ class ServiceManager:
             print(
                 f"{Colors.YELLOW}●{Colors.RESET} {__app_name__} is not running"
             )
-            if os.path.exists(PID_FILE):
-                os.remove(PID_FILE)
-            if os.path.exists(PAUSE_FILE):
-                os.remove(PAUSE_FILE)
+            remove_file(PID_FILE)
+            remove_file(PAUSE_FILE)
+            self._invalidate_pid_cache()
             return
 
         print(f"Stopping {__app_name__} (PID {pid})...")
 
+        # Type guard: pid is guaranteed to be int here since is_running is True
+        assert pid is not None, "PID should not be None when is_running is True"
         try:
-            # Type guard: pid is guaranteed to be int here since is_running is True
-            assert (
-                pid is not None
-            ), "PID should not be None when is_running is True"
-            os.kill(pid, signal.SIGTERM)
-            print(
-                f"{Colors.GREEN}✓{Colors.RESET} {__app_name__} stopped successfully"
-            )
+            exited = terminate_process(pid, _STOP_TIMEOUT_SECONDS)
         except OSError:
             print(
                 f"{Colors.YELLOW}!{Colors.RESET} Process {pid} already stopped"
             )
-        finally:
-            if os.path.exists(PID_FILE):
-                os.remove(PID_FILE)
-            if os.path.exists(PAUSE_FILE):
-                os.remove(PAUSE_FILE)
-            # if os.path.exists(LOG_FILE): os.remove(LOG_FILE)
+        else:
+            if not exited:
+                # Keep the PID file so the daemon can still be found.
+                print(
+                    f"{Colors.RED}✗{Colors.RESET} {__app_name__} (PID {pid}) "
+                    f"did not exit within {_STOP_TIMEOUT_SECONDS:g}s"
+                )
+                self._invalidate_pid_cache()
+                return
+            print(
+                f"{Colors.GREEN}✓{Colors.RESET} {__app_name__} stopped successfully"
+            )
+
+        remove_file(PID_FILE)
+        remove_file(PAUSE_FILE)
+        self._invalidate_pid_cache()
 
     def restart(self) -> None:
         """Restarts the background monitor."""
         print(f"\n{Colors.BOLD}Restarting {__app_name__}..{Colors.RESET}")
+        # stop() returns once the old daemon has exited.
         self.stop()
-        time.sleep(1)
         self.start()
 
     def pause(self, hours: float) -> None:
@@ -258,78 +425,66 @@ class ServiceManager:
         """
         pid, is_running = self._get_pid_status()
 
-        print(f"\n{Colors.BOLD}{__app_name__} Monitor Status{Colors.RESET}")
-        print("─" * 50)
+        # Collect the whole printout and write it in one go.
+        lines = [_STATUS_HEADER, _SEPARATOR]
 
         if is_running:
-            print(f"Status:     {Colors.GREEN}● RUNNING{Colors.RESET}")
-            print(f"PID:        {pid}")
+            lines.append(_RUNNING_LINE)
+            lines.append(f"PID:        {pid}")
 
-            try:
-                result = subprocess.run(
-                    ["ps", "-p", str(pid), "-o", "etime="],
-                    capture_output=True,
-                    text=True,
-                )
+            uptime = process_uptime(pid) if pid is not None else None
+            if uptime is not None:
+                lines.append(f"Uptime:     {format_elapsed(uptime)}")
 
-                if uptime := result.stdout.strip():
-                    print(f"Uptime:     {uptime}")
-
-            except Exception:
-                pass
+            lines.append(f"Target:     {TARGET_DEVICE_NAME}")
+            lines.append(f"Address:    {TARGET_DEVICE_MAC_ADDRESS}")
+            lines.append(f"Threshold:  {DISTANCE_THRESHOLD_M}m")
 
-            print(f"Target:     {TARGET_DEVICE_NAME}")
-            print(f"Address:    {TARGET_DEVICE_MAC_ADDRESS}")
-            print(f"Threshold:  {DISTANCE_THRESHOLD_M}m")
-
-            if os.path.exists(PAUSE_FILE):
-                try:
-                    with open(PAUSE_FILE, "r") as f:
-                        resume_time = float(f.read().strip())
-                    remaining = resume_time - time.time()
-                    if remaining > 0:
-                        hours, remainder = divmod(int(remaining), 3600)
-                        minutes, seconds = divmod(remainder, 60)
-                        print(
-                            f"State:      {Colors.YELLOW}PAUSED{Colors.RESET} (Resumes in {hours}h {minutes}m)"
-                        )
-                    else:
-                        print(
-                            f"State:      {Colors.GREEN}RESUMING{Colors.RESET}"
-                        )
-                except (IOError, ValueError):
-                    print(
-                        f"State:      {Colors.YELLOW}PAUSED{Colors.RESET} (Corrupted pause file)"
+            try:
+                with open(PAUSE_FILE, "r") as f:
+                    resume_time = float(f.read().strip())
+                remaining = resume_time - time.time()
+                if remaining > 0:
+                    hours, remainder = divmod(int(remaining), 3600)
+                    minutes, seconds = divmod(remainder, 60)
+                    lines.append(
+                        f"State:      {Colors.YELLOW}PAUSED{Colors.RESET} (Resumes in {hours}h {minutes}m)"
                     )
+                else:
+                    lines.append(
+                        f"State:      {Colors.GREEN}RESUMING{Colors.RESET}"
+                    )
+            except FileNotFoundError:
+                pass  # Not paused
+            except (IOError, ValueError):
+                lines.append(
+                    f"State:      {Colors.YELLOW}PAUSED{Colors.RESET} (Corrupted pause file)"
+                )
 
             if update_available:
-                print(
-                    f"\n{Colors.YELLOW}⚠ Update available: v{update_available}"
-                    f" — run 'brios --update' to upgrade{Colors.RESET}"
-                )
+                lines.append(_UPDATE_NOTICE.format(version=update_available))
 
-            if os.path.exists(LOG_FILE):
-                print(f"\nLog file:   {LOG_FILE}")
-                try:
-                    with open(LOG_FILE, "r") as f:
-                        lines = f.readlines()
-                        if lines:
-                            recent = lines[-3:] if len(lines) >= 3 else lines
-                            print(f"\nRecent activity:")
-                            for line in recent:
-                                print(f"  {line.rstrip()}")
-                except Exception:
-                    pass
+            try:
+                recent: Optional[List[str]] = tail_lines(LOG_FILE, 3)
+            except Exception:
+                recent = None
+            if recent is not None:
+                lines.append(f"\nLog file:   {LOG_FILE}")
+                if recent:
+                    lines.append("\nRecent activity:")
+                    lines.extend(f"  {line.rstrip()}" for line in recent)
         else:
-            print(f"Status:     {Colors.RED}● STOPPED{Colors.RESET}")
-            print(f"PID File:   Not found")
+            lines.append(_STOPPED_LINE)
+            lines.append("PID File:   Not found")
 
-        print("─" * 50 + "\n")
+        lines.append(_SEPARATOR + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _print_start_status(
         self,
         target_address: Optional[str],
         *,
+        ready: Optional[bool] = True,
         update_available: Optional[str] = None,
     ) -> None:
         """Prints a detailed summary after a start attempt.
@@ -337,50 +492,63 @@ class ServiceManager:
         Args:
             target_address: The MAC or UUID address of the
                 device being monitored.
+            ready: Whether the daemon reported that its scanner started, or
+                None if it had not reported back yet (see _wait_for_daemon).
             update_available: The latest version string if an update is
                 available, or None.
         """
         pid, is_running = self._get_pid_status()
 
-        if not is_running:
-            print(f"{Colors.RED}✗{Colors.RESET} Failed to start {__app_name__}")
-            print(f"Log file:   {LOG_FILE}")
-            print("─" * 50 + "\n")
+        if ready is None and is_running:
+            # Still powering up Bluetooth; it may yet fail or succeed.
+            sys.stdout.write(
+                f"{_STILL_STARTING_LINE} (PID {pid})\n"
+                f"Use `{sys.argv[0]} --status` to check whether it came up.\n"
+                f"Log file:   {LOG_FILE}\n{_SEPARATOR}\n\n"
+            )
             return
 
-        print(
-            f"{Colors.GREEN}✓{Colors.RESET} {__app_name__} started successfully"
-        )
-        print(f"PID:        {pid}")
-        print("─" * 50)
-        print(f"Target:     {TARGET_DEVICE_NAME} ({TARGET_DEVICE_TYPE})")
+        if not (ready and is_running):
+            sys.stdout.write(
+                f"{_START_FAILED_LINE}\nLog file:   {LOG_FILE}\n"
+                f"{_SEPARATOR}\n\n"
+            )
+            return
 
+        lines = [
+            _STARTED_LINE,
+            f"PID:        {pid}",
+            _SEPARATOR,
+            f"Target:     {TARGET_DEVICE_NAME} ({TARGET_DEVICE_TYPE})",
+        ]
         if target_address:
-            print(f"Address:    {target_address}")
+            lines.append(f"Address:    {target_address}")
 
-        print(f"Threshold:  {DISTANCE_THRESHOLD_M}m")
-        print(f"TX Power:   {TX_POWER_AT_1M} dBm @ 1m")
-        print(f"Path Loss:  {PATH_LOSS_EXPONENT}")
-        print(f"Samples:    {SAMPLE_WINDOW} readings")
+        lines += (
+            f"Threshold:  {DISTANCE_THRESHOLD_M}m",
+            f"TX Power:   {TX_POWER_AT_1M} dBm @ 1m",
+            f"Path Loss:  {PATH_LOSS_EXPONENT}",
+            f"Samples:    {SAMPLE_WINDOW} readings",
+        )
 
         if self.args.macos_use_bdaddr:
-            print(f"Mode:       {Colors.BLUE}BD_ADDR (MAC){Colors.RESET}")
+            lines.append(
+                f"Mode:       {Colors.BLUE}BD_ADDR (MAC){Colors.RESET}"
+            )
         else:
-            print(f"Mode:       UUID (Privacy Mode)")
-        print("─" * 50)
+            lines.append("Mode:       UUID (Privacy Mode)")
+        lines.append(_SEPARATOR)
 
-        print(f"Log file:   {LOG_FILE} {Colors.GREEN}(enabled){Colors.RESET}")
+        lines.append(
+            f"Log file:   {LOG_FILE} {Colors.GREEN}(enabled){Colors.RESET}"
+        )
 
         if update_available:
-            print(
-                f"\n{Colors.YELLOW}⚠ Update available: v{update_available}"
-                f" — run 'brios --update' to upgrade{Colors.RESET}"
-            )
+            lines.append(_UPDATE_NOTICE.format(version=update_available))
 
-        print(
-            f"\n{Colors.GREEN}●{Colors.RESET} {__app_name__} running in background"
-        )
-        print(
+        lines.append(_RUNNING_IN_BACKGROUND)
+        lines.append(
             f"\nUse `{sys.argv[0]} --status` to check status or "
             f"`--stop` to terminate."
         )
+        sys.stdout.write("\n".join(lines) + "\n")
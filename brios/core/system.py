@@ -1,8 +1,13 @@
+import os
 import sys
+import time
+import errno
+import select
+import signal
 import subprocess
 import ctypes
 import ctypes.util
-from typing import Tuple
+from typing import Optional, Tuple
 
 # Platform-specific imports
 IS_MACOS = sys.platform == "darwin"
@@ -68,6 +73,237 @@ def is_screen_locked() -> bool:
         return False
 
 
+# proc_pidinfo() flavor returning a struct proc_bsdinfo (<sys/proc_info.h>).
+_PROC_PIDTBSDINFO = 3
+
+
+class _ProcBsdInfo(ctypes.Structure):
+    """Mirror of the macOS ``struct proc_bsdinfo``."""
+
+    _fields_ = [
+        ("pbi_flags", ctypes.c_uint32),
+        ("pbi_status", ctypes.c_uint32),
+        ("pbi_xstatus", ctypes.c_uint32),
+        ("pbi_pid", ctypes.c_uint32),
+        ("pbi_ppid", ctypes.c_uint32),
+        ("pbi_uid", ctypes.c_uint32),
+        ("pbi_gid", ctypes.c_uint32),
+        ("pbi_ruid", ctypes.c_uint32),
+        ("pbi_rgid", ctypes.c_uint32),
+        ("pbi_svuid", ctypes.c_uint32),
+        ("pbi_svgid", ctypes.c_uint32),
+        ("rfu_1", ctypes.c_uint32),
+        ("pbi_comm", ctypes.c_char * 16),
+        ("pbi_name", ctypes.c_char * 32),
+        ("pbi_nfiles", ctypes.c_uint32),
+        ("pbi_pgid", ctypes.c_uint32),
+        ("pbi_pjobc", ctypes.c_uint32),
+        ("e_tdev", ctypes.c_uint32),
+        ("e_tpgid", ctypes.c_uint32),
+        ("pbi_nice", ctypes.c_int32),
+        ("pbi_start_tvsec", ctypes.c_uint64),
+        ("pbi_start_tvusec", ctypes.c_uint64),
+    ]
+
+
+def process_uptime(pid: int) -> Optional[float]:
+    """Returns how long a process has been running, without spawning ``ps``.
+
+    Uses ``proc_pidinfo`` from libproc on macOS and ``/proc`` on Linux.
+
+    Args:
+        pid: The process ID to inspect.
+
+    Returns:
+        The process uptime in seconds, or None if it cannot be determined.
+    """
+    try:
+        if IS_MACOS:
+            libproc = ctypes.CDLL("/usr/lib/libproc.dylib")
+            info = _ProcBsdInfo()
+            size = libproc.proc_pidinfo(
+                pid,
+                _PROC_PIDTBSDINFO,
+                ctypes.c_uint64(0),
+                ctypes.byref(info),
+                ctypes.sizeof(info),
+            )
+            if size != ctypes.sizeof(info):
+                return None
+            started: float = info.pbi_start_tvsec + (
+                info.pbi_start_tvusec / 1e6
+            )
+            return max(0.0, time.time() - started)
+
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        # Field 22 (starttime, in clock ticks since boot); the command name
+        # in field 2 may contain spaces, so split after its closing paren.
+        start_ticks = int(stat[stat.rindex(b")") + 2 :].split()[19])
+        with open("/proc/uptime", "rb") as f:
+            system_uptime = float(f.read().split()[0])
+        return max(0.0, system_uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+# Buffer size for proc_pidpath() (PROC_PIDPATHINFO_MAXSIZE in <libproc.h>).
+_PROC_PIDPATHINFO_MAXSIZE = 4096
+
+
+def is_python_process(pid: int) -> bool:
+    """Checks that a PID belongs to a live Python interpreter.
+
+    ``os.kill(pid, 0)`` only proves that *some* process has the PID, so a
+    stale PID file can look alive once the number is reused. Reading the
+    executable path answers both questions with one call: via ``/proc``
+    on Linux and ``proc_pidpath`` from libproc on macOS. Other platforms
+    fall back to the signal check.
+
+    Args:
+        pid: The process ID to inspect.
+
+    Returns:
+        True if the process exists and runs a Python executable.
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            path = os.readlink(f"/proc/{pid}/exe")
+        elif IS_MACOS:
+            libproc = ctypes.CDLL("/usr/lib/libproc.dylib")
+            buf = ctypes.create_string_buffer(_PROC_PIDPATHINFO_MAXSIZE)
+            length = libproc.proc_pidpath(pid, buf, _PROC_PIDPATHINFO_MAXSIZE)
+            if length <= 0:
+                return False
+            path = os.fsdecode(buf.raw[:length])
+        else:
+            os.kill(pid, 0)
+            return True
+    except OSError:
+        return False
+    return "python" in os.path.basename(path).lower()
+
+
+def terminate_process(pid: int, timeout: float = 5.0) -> bool:
+    """Sends SIGTERM to a process and waits for it to exit.
+
+    On Linux the process is addressed through a pidfd, which cannot be
+    redirected to another process if the PID is reused, and becomes
+    readable the moment the process exits. Elsewhere the PID is signalled
+    directly and polled with a growing interval.
+
+    Args:
+        pid: The process ID to terminate.
+        timeout: The maximum time to wait for the exit, in seconds.
+
+    Returns:
+        True if the process exited within the timeout.
+
+    Raises:
+        OSError: If the process does not exist or cannot be signalled.
+    """
+    if sys.platform == "linux":
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError as e:
+            if e.errno != errno.ENOSYS:
+                raise
+        else:
+            try:
+                signal.pidfd_send_signal(pidfd, signal.SIGTERM)
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                return bool(poller.poll(timeout * 1000))
+            finally:
+                os.close(pidfd)
+
+    os.kill(pid, signal.SIGTERM)
+    deadline = time.monotonic() + timeout
+    interval = 0.01
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, 0.2)
+
+
+# Set once the screensaver password policy has been written this session.
+_lock_prepared = False
+
+# The com.apple.screensaver settings prepare_lock() enforces, as
+# (key, integer value).
+_PASSWORD_POLICY: Tuple[Tuple[str, str], ...] = (
+    ("askForPassword", "1"),
+    ("askForPasswordDelay", "0"),
+)
+
+
+def _password_policy_applied() -> bool:
+    """Checks whether the screensaver password policy is already in place.
+
+    A single ``defaults read`` of the whole domain covers both keys, so a
+    machine that already has the policy needs one process instead of two
+    writes.
+
+    Returns:
+        True if every key in _PASSWORD_POLICY has the required value.
+    """
+    try:
+        result = subprocess.run(
+            ["defaults", "read", "com.apple.screensaver"],
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return False
+    # Old-style plist output: one "    key = value;" line per setting.
+    settings = {
+        key.strip(): value.strip().rstrip(";")
+        for key, sep, value in (
+            line.partition("=") for line in result.stdout.splitlines()
+        )
+        if sep
+    }
+    return all(settings.get(key) == value for key, value in _PASSWORD_POLICY)
+
+
+def prepare_lock() -> None:
+    """Requires the password immediately after the display sleeps.
+
+    The policy is read once and only written if needed; either way this
+    runs once per process, and later calls return without spawning
+    anything.
+
+    Raises:
+        subprocess.CalledProcessError: If a ``defaults`` command fails.
+        OSError: If the ``defaults`` binary cannot be executed.
+    """
+    global _lock_prepared
+    if _lock_prepared or not IS_MACOS:
+        return
+
+    if not _password_policy_applied():
+        for key, value in _PASSWORD_POLICY:
+            subprocess.run(
+                [
+                    "defaults",
+                    "write",
+                    "com.apple.screensaver",
+                    key,
+                    "-int",
+                    value,
+                ],
+                check=True,
+                capture_output=True,
+            )
+    _lock_prepared = True
+
+
 def lock_macbook() -> Tuple[bool, str]:
     """Executes system commands to immediately lock the macOS screen.
 
@@ -79,31 +315,7 @@ def lock_macbook() -> Tuple[bool, str]:
 
     try:
         # First, ensure password is required immediately after sleep
-        subprocess.run(
-            [
-                "defaults",
-                "write",
-                "com.apple.screensaver",
-                "askForPassword",
-                "-int",
-                "1",
-            ],
-            check=True,
-            capture_output=True,
-        )
-
-        subprocess.run(
-            [
-                "defaults",
-                "write",
-                "com.apple.screensaver",
-                "askForPasswordDelay",
-                "-int",
-                "0",
-            ],
-            check=True,
-            capture_output=True,
-        )
+        prepare_lock()
 
         # Now lock the screen by putting display to sleep
         subprocess.run(
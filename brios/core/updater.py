@@ -78,11 +78,11 @@ def _read_cache() -> Optional[dict]:
         otherwise ``None``.
     """
     try:
-        if os.path.exists(_CACHE_FILE):
-            with open(_CACHE_FILE, "r") as f:
-                result: dict = json.load(f)
-                return result
+        with open(_CACHE_FILE, "r") as f:
+            result: dict = json.load(f)
+            return result
     except (json.JSONDecodeError, IOError, OSError):
+        # Includes FileNotFoundError when no check has been cached yet.
         pass
     return None
 
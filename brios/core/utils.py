@@ -1,9 +1,10 @@
 import os
 import sys
+import math
 import argparse
-import statistics
+from array import array
 from dataclasses import dataclass
-from typing import Any, Deque, Optional
+from typing import Any, Collection, Iterator, List, Optional, Tuple, Union
 
 
 from .config import (
@@ -20,17 +21,10 @@ __app_full_name__ = (
     "Bluetooth Reactive Intelligent Operator for Croissant Safety"
 )
 
-SCRIPT_DIR = os.path.dirname(
-    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-)  # Point to project root roughly, or user home
-
-# For installed package, we might want to store PID/logs in user home or tmp
-# But for now, let's keep it compatible with existing logic or adapt.
-# Best practice is ~/.brios/ or similar.
-# Let's use user home for logs/pid if installed as package.
+# PID, log and pause files live in ~/.brios/ so they are shared by every
+# installation of the package.
 HOME_DIR = os.path.expanduser("~/.brios")
-if not os.path.exists(HOME_DIR):
-    os.makedirs(HOME_DIR, exist_ok=True)
+os.makedirs(HOME_DIR, exist_ok=True)
 
 PID_FILE = os.path.join(HOME_DIR, ".ble_monitor.pid")
 LOG_FILE = os.path.join(HOME_DIR, ".ble_monitor.log")
@@ -65,6 +59,41 @@ class Colors:
     RESET = "\033[0m"
 
 
+# (color, label) pairs ordered strong → medium → weak, indexed by
+# signal_strength().
+_SIGNAL_TIERS = (
+    (Colors.GREEN, "Strong"),
+    (Colors.YELLOW, "Medium"),
+    (Colors.RED, "Weak"),
+)
+
+
+def signal_strength(rssi: float) -> Tuple[str, str]:
+    """Classifies a signal strength for display.
+
+    Args:
+        rssi: The Received Signal Strength Indicator in dBm.
+
+    Returns:
+        A (color, label) tuple: green "Strong" for signals above -50 dBm,
+        yellow "Medium" above -70 dBm, and red "Weak" otherwise.
+    """
+    return _SIGNAL_TIERS[(rssi <= -50) + (rssi <= -70)]
+
+
+def signal_color(rssi: float) -> str:
+    """Returns the ANSI color used to display a given signal strength.
+
+    Args:
+        rssi: The Received Signal Strength Indicator in dBm.
+
+    Returns:
+        Green for strong signals (> -50 dBm), yellow for medium signals
+        (> -70 dBm), and red otherwise.
+    """
+    return signal_strength(rssi)[0]
+
+
 @dataclass
 class Flags:
     """A data class to hold boolean flags derived from command-line arguments.
@@ -80,6 +109,77 @@ class Flags:
     verbose: bool
 
 
+class RssiBuffer:
+    """A fixed-size ring buffer of RSSI samples with a running sum.
+
+    Behaves like a ``deque(maxlen=size)`` of ints for ``append``, ``clear``,
+    ``len`` and iteration, but stores the samples in a preallocated array
+    and keeps their sum up to date, so the mean is O(1) per sample.
+
+    Attributes:
+        maxlen: The number of samples the buffer holds when full.
+        total: The sum of the samples currently in the buffer.
+    """
+
+    __slots__ = ("maxlen", "total", "_samples", "_idx", "_count")
+
+    def __init__(self, maxlen: int) -> None:
+        """Initializes an empty buffer.
+
+        Args:
+            maxlen: The number of samples the buffer holds when full.
+        """
+        self.maxlen = maxlen
+        self.total = 0
+        self._samples = array("i", [0] * maxlen)
+        self._idx = 0
+        self._count = 0
+
+    def append(self, rssi: int) -> None:
+        """Adds a sample, evicting the oldest one once the buffer is full.
+
+        Args:
+            rssi: The RSSI value in dBm.
+        """
+        idx = self._idx
+        if self._count == self.maxlen:
+            self.total -= self._samples[idx]
+        else:
+            self._count += 1
+        self._samples[idx] = rssi
+        self.total += rssi
+        self._idx = (idx + 1) % self.maxlen
+
+    def clear(self) -> None:
+        """Removes all samples."""
+        self.total = 0
+        self._idx = 0
+        self._count = 0
+
+    def mean(self) -> Optional[float]:
+        """Returns the mean of the buffered samples, or None if empty."""
+        return self.total / self._count if self._count else None
+
+    def values(self) -> "array[int]":
+        """Returns a copy of the buffered samples in storage order.
+
+        The samples occupy the first ``len(self)`` slots until the buffer
+        wraps, so this is a single C-level slice rather than a walk in
+        age order. Use it where order does not matter, e.g. for a median.
+        """
+        return self._samples[: self._count]
+
+    def __len__(self) -> int:
+        """Returns the number of buffered samples."""
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        """Yields the buffered samples from oldest to newest."""
+        start = (self._idx - self._count) % self.maxlen
+        for i in range(self._count):
+            yield self._samples[(start + i) % self.maxlen]
+
+
 def determine_target_address(args: argparse.Namespace) -> Optional[str]:
     """Determines the target address based on command-line arguments.
 
@@ -89,26 +189,140 @@ def determine_target_address(args: argparse.Namespace) -> Optional[str]:
     Returns:
         The target address string if found; otherwise, None.
     """
-    if args.target_mac:
-        return (
-            TARGET_DEVICE_MAC_ADDRESS
-            if args.target_mac == "USE_DEFAULT"
-            else args.target_mac
-        )
-    if args.target_uuid:
-        return (
-            TARGET_DEVICE_UUID_ADDRESS
-            if args.target_uuid == "USE_DEFAULT"
-            else args.target_uuid
-        )
-
-    # If no explicit target is provided, try to use the default from .env
-    if TARGET_DEVICE_MAC_ADDRESS:
-        return TARGET_DEVICE_MAC_ADDRESS
-    if TARGET_DEVICE_UUID_ADDRESS:
-        return TARGET_DEVICE_UUID_ADDRESS
-
-    return None
+    # A bare --target-mac/--target-uuid is resolved to the configured
+    # address by the parser. If no explicit target is provided, try to use
+    # the default from .env.
+    return (
+        args.target_mac
+        or args.target_uuid
+        or TARGET_DEVICE_MAC_ADDRESS
+        or TARGET_DEVICE_UUID_ADDRESS
+        or None
+    )
+
+
+def tail_lines(path: str, n: int = 3, block_size: int = 4096) -> List[str]:
+    """Returns the last lines of a file without reading all of it.
+
+    Blocks are read backwards from the end of the file until enough
+    newlines have been seen, so the cost does not grow with the file size.
+
+    Args:
+        path: The file to read.
+        n: The number of trailing lines to return.
+        block_size: The number of bytes read per step.
+
+    Returns:
+        Up to ``n`` lines, oldest first, without line endings.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        pos = os.lseek(fd, 0, os.SEEK_END)
+        data = b""
+        # One newline more than n is needed, as the file usually ends in one.
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            os.lseek(fd, pos, os.SEEK_SET)
+            data = os.read(fd, step) + data
+    finally:
+        os.close(fd)
+    return data.decode("utf-8", errors="replace").splitlines()[-n:]
+
+
+def format_elapsed(seconds: float) -> str:
+    """Formats a duration the way ``ps -o etime`` does.
+
+    Args:
+        seconds: The elapsed time in seconds.
+
+    Returns:
+        The duration as ``[[DD-]HH:]MM:SS``.
+    """
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days:02d}-{hours:02d}:{minutes:02d}:{secs:02d}"
+    if hours:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def remove_file(path: str) -> None:
+    """Deletes a file, doing nothing if it does not exist.
+
+    A single ``unlink`` replaces the usual ``exists`` check followed by
+    ``remove``, which costs an extra ``stat`` and races with other writers.
+
+    Args:
+        path: The file to delete.
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def write_pid_file(path: str, pid: int) -> None:
+    """Atomically writes a PID to the given file.
+
+    The PID is written to a temporary sibling file which is then renamed
+    over *path*, so readers never observe a partially written PID file.
+
+    Args:
+        path: The PID file path.
+        pid: The process ID to record.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, f"{pid}\n".encode())
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def read_pid_file(path: str) -> int:
+    """Reads a PID from the given file using a single unbuffered read.
+
+    Args:
+        path: The PID file path.
+
+    Returns:
+        The process ID stored in the file.
+
+    Raises:
+        OSError: If the file does not exist or cannot be read.
+        ValueError: If the file does not contain a valid PID.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        data = os.read(fd, 32)
+    finally:
+        os.close(fd)
+    return int(data.strip())
+
+
+# The constant 10 ** (tx / 10n) factor for the configured parameters, and
+# -ln(10) / 10n, so the common case in estimate_distance() is a single exp
+# and multiply (exp skips the special-casing math.pow does on its base).
+_INV_TEN_N = 1.0 / (10.0 * PATH_LOSS_EXPONENT)
+_POW_BASE = math.pow(10.0, TX_POWER_AT_1M * _INV_TEN_N)
+_EXP_SCALE = -math.log(10.0) * _INV_TEN_N
+
+# Distances for every integer RSSI a BLE controller can report
+# ([-128, 20] dBm) under the configured parameters, indexed by rssi + 128.
+_DIST_LUT_OFFSET = 128
+_DIST_LUT = tuple(
+    _POW_BASE * math.exp(rssi * _EXP_SCALE) for rssi in range(-128, 21)
+)
 
 
 def estimate_distance(
@@ -130,11 +344,22 @@ def estimate_distance(
     """
     if rssi == 0:
         return -1.0
-    return 10 ** ((tx_power_at_1m - rssi) / (10 * path_loss_exponent))
+    if (
+        tx_power_at_1m == TX_POWER_AT_1M
+        and path_loss_exponent == PATH_LOSS_EXPONENT
+    ):
+        # Whole-dBm readings come straight from the lookup table; smoothed
+        # fractional values are computed exactly rather than rounded.
+        idx = int(rssi) + _DIST_LUT_OFFSET
+        if idx - _DIST_LUT_OFFSET == rssi and 0 <= idx < len(_DIST_LUT):
+            return _DIST_LUT[idx]
+        return _POW_BASE * math.exp(rssi * _EXP_SCALE)
+    return math.pow(10.0, (tx_power_at_1m - rssi) / (10.0 * path_loss_exponent))
 
 
 def smooth_rssi(
-    buffer: Deque[int], method: str = SMOOTHING_METHOD
+    buffer: Union[RssiBuffer, Collection[int]],
+    method: str = SMOOTHING_METHOD,
 ) -> Optional[float]:
     """Calculates the statistical mean or median of RSSI values in a buffer.
 
@@ -142,7 +367,8 @@ def smooth_rssi(
     a collection of recent samples.
 
     Args:
-        buffer: A deque containing recent RSSI samples (integers).
+        buffer: The recent RSSI samples (integers), e.g. a deque or an
+            RssiBuffer.
         method: The smoothing method to use ('mean' or 'median').
 
     Returns:
@@ -151,9 +377,17 @@ def smooth_rssi(
     if not buffer:
         return None
     if method == "mean":
-        return float(statistics.mean(buffer))
+        if isinstance(buffer, RssiBuffer):
+            return buffer.mean()
+        return sum(buffer) / len(buffer)
+    if isinstance(buffer, RssiBuffer):
+        ordered = sorted(buffer.values())
     else:
-        return float(statistics.median(buffer))
+        ordered = sorted(buffer)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return float(ordered[mid])
+    return (ordered[mid - 1] + ordered[mid]) / 2
 
 
 # --- Monkeypatch for Bleak 1.1.1 Crash ---
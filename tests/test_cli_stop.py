@@ -1,8 +1,9 @@
+import argparse
 import pytest
 import sys
 from unittest.mock import patch, MagicMock
 from brios.cli import main, Application
-from typing import Any, Generator
+from typing import Any, Generator, Optional
 
 
 @pytest.fixture
@@ -69,3 +70,120 @@ def test_week_without_stop(mock_service_manager: MagicMock) -> None:
         with pytest.raises(SystemExit) as e:
             main()
         assert e.value.code == 2
+
+
+def test_help_epilog_built_lazily() -> None:
+    parser = Application.setup_parser()
+    assert parser.epilog is None
+
+    help_text = parser.format_help()
+    assert "CONFIGURATION:" in help_text
+    assert parser.epilog is not None
+
+
+def test_service_command_skips_event_loop(
+    mock_service_manager: MagicMock,
+) -> None:
+    with (
+        patch("sys.argv", ["brios", "--status"]),
+        patch("brios.cli.check_for_update", return_value=None),
+        patch("brios.cli.asyncio.run") as mock_run,
+    ):
+        main()
+    mock_service_manager.return_value.display_status.assert_called_once()
+    mock_run.assert_not_called()
+
+
+@pytest.mark.parametrize("flag", ["--status", "--stop", "--restart"])
+def test_fast_path_matches_parser(flag: str) -> None:
+    from brios.cli import _parse_fast_path
+
+    expected = Application.setup_parser().parse_args([flag])
+    assert _parse_fast_path([flag]) == expected
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--target-mac", "AA:BB:CC:DD:EE:FF", "-m", "-f", "-v", "--daemon"],
+        ["--target-uuid", "1234-ABCD", "-f", "-v", "--daemon"],
+        ["-m", "-f", "-v", "--daemon"],
+        ["-f", "-v", "--daemon"],
+    ],
+)
+def test_fast_path_matches_parser_for_daemon(argv: list) -> None:
+    from brios.cli import _parse_fast_path
+
+    expected = Application.setup_parser().parse_args(argv)
+    assert _parse_fast_path(argv) == expected
+
+
+@pytest.mark.parametrize(
+    "target_mac, target_uuid, use_bdaddr",
+    [
+        ("AA:BB:CC:DD:EE:FF", None, True),
+        (None, "1234-ABCD", False),
+        (None, None, False),
+    ],
+)
+def test_daemon_command_round_trips(
+    target_mac: Optional[str], target_uuid: Optional[str], use_bdaddr: bool
+) -> None:
+    from brios.cli import _parse_daemon_command
+    from brios.core.service import ServiceManager
+
+    args = argparse.Namespace(
+        target_mac=target_mac,
+        target_uuid=target_uuid,
+        scanner=None,
+        macos_use_bdaddr=use_bdaddr,
+    )
+    with patch("sys.argv", ["brios"]):
+        argv = ServiceManager(args)._reconstruct_command()[1:]
+
+    expected = Application.setup_parser().parse_args(argv)
+    assert _parse_daemon_command(argv) == expected
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--target-mac", "-f", "-v", "--daemon"],
+        ["--scanner", "10", "-f", "-v", "--daemon"],
+        ["-v", "-f", "--daemon"],
+        ["--daemon"],
+    ],
+)
+def test_fast_path_defers_other_daemon_lines(argv: list) -> None:
+    from brios.cli import _parse_fast_path
+
+    assert _parse_fast_path(argv) is None
+
+
+def test_fast_path_skips_parser(mock_service_manager: MagicMock) -> None:
+    with (
+        patch("sys.argv", ["brios", "--stop"]),
+        patch.object(Application, "setup_parser") as mock_setup,
+    ):
+        main()
+    mock_setup.assert_not_called()
+    mock_service_manager.return_value.stop.assert_called_once()
+
+
+def test_bare_target_flag_uses_configured_address() -> None:
+    with (
+        patch("brios.cli.TARGET_DEVICE_MAC_ADDRESS", "AA:BB:CC:DD:EE:FF"),
+        patch("brios.cli.TARGET_DEVICE_UUID_ADDRESS", "UUID-1234"),
+    ):
+        parser = Application.setup_parser()
+    assert parser.parse_args(["-tm"]).target_mac == "AA:BB:CC:DD:EE:FF"
+    assert parser.parse_args(["-tu"]).target_uuid == "UUID-1234"
+    assert parser.parse_args(["-tm", "11:22"]).target_mac == "11:22"
+
+
+def test_bare_target_flag_without_configured_address() -> None:
+    with patch("brios.cli.TARGET_DEVICE_MAC_ADDRESS", None):
+        parser = Application.setup_parser()
+    with pytest.raises(SystemExit) as e:
+        parser.parse_args(["-tm"])
+    assert e.value.code == 2
@@ -1,9 +1,11 @@
 import sys
+import time
 import asyncio
+import threading
 import pytest
-from typing import Any
-from unittest.mock import MagicMock, patch, call, ANY
-from collections import deque
+from typing import Any, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch, call, ANY
+from array import array
 import importlib
 
 
@@ -86,10 +88,41 @@ async def test_monitor_initialization(monitor: Any) -> None:
     Args:
         monitor: The DeviceMonitor fixture.
     """
+    from brios.core.utils import RssiBuffer
+
     assert monitor.target_address == "AA:BB:CC:DD:EE:FF"
     assert monitor.use_bdaddr is True
     assert monitor.flags.verbose is True
-    assert isinstance(monitor.rssi_buffer, deque)
+    assert isinstance(monitor.rssi_buffer, RssiBuffer)
+
+
+@pytest.mark.parametrize(
+    "platform, target, expected",
+    [
+        (
+            "linux",
+            "AA:BB:CC:DD:EE:FF",
+            {"filters": {"Pattern": "AA:BB:CC:DD:EE:FF"}},
+        ),
+        ("linux", "12345678-1234-1234-1234-123456789ABC", {}),
+        ("darwin", "AA:BB:CC:DD:EE:FF", {}),
+    ],
+)
+def test_new_scanner_filters_in_bluez(
+    monitor: Any, platform: str, target: str, expected: dict
+) -> None:
+    """Test that a MAC target is filtered by BlueZ on Linux only."""
+    import brios.core.monitor
+
+    monitor.target_address = target
+    with patch.object(sys, "platform", platform):
+        monitor._new_scanner()
+
+    brios.core.monitor.BleakScanner.assert_called_with(
+        detection_callback=monitor._detection_callback,
+        cb={"use_bdaddr": True},
+        bluez=expected,
+    )
 
 
 @pytest.mark.asyncio
@@ -115,16 +148,90 @@ async def test_process_signal_out_of_range(
     # Patch the system module as accessed by monitor
     with (
         patch("brios.core.monitor.system.lock_macbook") as mock_lock,
-        patch.object(monitor, "_handle_screen_lock") as mock_handle_lock,
         patch("brios.core.monitor.OUT_OF_RANGE_DEBOUNCE_COUNT", 1),
     ):
         mock_lock.return_value = (True, "Mock Locked")
 
         monitor._detection_callback(mock_device, mock_adv)
+        await asyncio.sleep(0)  # let the burst drain run
+        assert monitor.alert_triggered is True
+        assert monitor._alert_task is not None
+        await monitor._alert_task  # lock_macbook runs in the executor
 
         mock_lock.assert_called_once()
         assert monitor.alert_triggered is True
-        mock_handle_lock.assert_called_once()
+        assert monitor._lock_trigger.is_set()
+
+
+@pytest.mark.asyncio
+async def test_in_range_waits_for_pending_lock(
+    monitor: Any, mock_device: MagicMock, mock_adv: MagicMock
+) -> None:
+    """Test that a back-in-range sample is held while the lock runs."""
+    monitor.resume_time = -1000  # Ensure grace period has passed
+    monitor.target_address = "AA:BB:CC:DD:EE:FF"
+    mock_device.address = "AA:BB:CC:DD:EE:FF"
+    release = threading.Event()
+
+    def slow_lock() -> Tuple[bool, str]:
+        release.wait(timeout=5.0)
+        return True, "Mock Locked"
+
+    def send(rssi: int) -> None:
+        monitor._reset_smoothing()
+        for _ in range(11):
+            monitor.rssi_buffer.append(rssi)
+        mock_adv.rssi = rssi
+        monitor._detection_callback(mock_device, mock_adv)
+
+    with (
+        patch("brios.core.monitor.system.lock_macbook", side_effect=slow_lock),
+        patch("brios.core.monitor.OUT_OF_RANGE_DEBOUNCE_COUNT", 1),
+        patch("builtins.print") as mock_print,
+    ):
+        send(-80)
+        await asyncio.sleep(0)  # let the burst drain start the alert
+        alert_task = monitor._alert_task
+        assert alert_task is not None
+        await asyncio.sleep(0)  # the banner is out, the lock is pending
+
+        send(-40)
+        await asyncio.sleep(0)
+        assert monitor.alert_triggered is True
+        send(-80)
+        await asyncio.sleep(0)
+        assert monitor._alert_task is alert_task  # no second lock
+
+        release.set()
+        await alert_task
+        printed = "".join(str(c.args[0]) for c in mock_print.call_args_list)
+        assert "ALERT" in printed and "Back in Range" not in printed
+
+        send(-40)
+        await asyncio.sleep(0)
+        assert monitor.alert_triggered is False
+
+
+@pytest.mark.asyncio
+async def test_lock_worker_runs_handler_once_per_trigger(monitor: Any) -> None:
+    """Test that repeated triggers share one handler run in one task."""
+    calls = 0
+
+    async def fake_handler() -> None:
+        nonlocal calls
+        calls += 1
+        monitor._lock_trigger.set()  # requests while handling are dropped
+
+    with patch.object(monitor, "_handle_screen_lock", fake_handler):
+        monitor._start_lock_worker()
+        monitor._lock_trigger.set()
+        monitor._lock_trigger.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert calls == 1
+        assert not monitor._lock_trigger.is_set()
+        monitor._lock_worker_task.cancel()
 
 
 @pytest.mark.asyncio
@@ -150,6 +257,7 @@ async def test_process_signal_back_in_range(
     ):
 
         monitor._detection_callback(mock_device, mock_adv)
+        await asyncio.sleep(0)  # let the burst drain run
 
         mock_lock.assert_not_called()
         assert monitor.alert_triggered is False
@@ -160,9 +268,7 @@ async def test_grace_period_active(
     monitor: Any, mock_device: MagicMock, mock_adv: MagicMock
 ) -> None:
     """Test that signals are ignored during grace period."""
-    import time
-
-    monitor.resume_time = time.monotonic()
+    monitor._start_grace_period()
     monitor.rssi_buffer.clear()
     for _ in range(11):
         monitor.rssi_buffer.append(-80)
@@ -174,19 +280,486 @@ async def test_grace_period_active(
 
     with patch("brios.core.monitor.system.lock_macbook") as mock_lock:
         monitor._detection_callback(mock_device, mock_adv)
+        await asyncio.sleep(0)  # let the burst drain run
         mock_lock.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_grace_period_expires(monitor: Any) -> None:
+    """Test that the grace period timer re-enables alerts."""
+    with patch("brios.core.monitor.GRACE_PERIOD_SECONDS", 0):
+        monitor._start_grace_period()
+        assert monitor._in_grace is True
+
+        await asyncio.sleep(0.01)
+        assert monitor._in_grace is False
+
+
 @pytest.mark.asyncio
 async def test_lock_loop_protection(monitor: Any) -> None:
     """Test that rapid locking triggers pause."""
     import time
 
-    monitor.lock_history.clear()
     now = time.monotonic()
+    with (
+        patch("brios.core.monitor.LOCK_LOOP_THRESHOLD", 3),
+        patch("brios.core.monitor.LOCK_LOOP_WINDOW", 60),
+    ):
+        monitor.lock_history = array("d", [0.0] * 3)
+
+        assert monitor._record_lock_event(now) is None
+        assert monitor._record_lock_event(now + 1) is None
+        assert monitor._record_lock_event(now + 2) == pytest.approx(2.0)
+
+        # The oldest event drops out of the window once the ring wraps
+        assert monitor._record_lock_event(now + 100) is None
+
+
+@pytest.mark.asyncio
+async def test_process_signal_ema(monitor: Any) -> None:
+    """Test that EMA smoothing reports from the first sample without a buffer."""
+    with (
+        patch("brios.core.monitor.SMOOTHING_METHOD", "ema"),
+        patch("brios.core.monitor.EMA_ALPHA", 0.5),
+    ):
+        smoothed, distance = monitor._process_signal(-60)
+        assert smoothed == pytest.approx(-60.0)
+        assert distance is not None
+
+        smoothed, _ = monitor._process_signal(-70)
+        assert smoothed == pytest.approx(-65.0)
+
+    assert len(monitor.rssi_buffer) == 0
+
+
+@pytest.mark.parametrize(
+    "method, expected", [("mean", -62.0), ("median", -60.0)]
+)
+def test_process_signal_full_window(
+    monitor: Any, method: str, expected: float
+) -> None:
+    """Test the smoothed value once the window is full, per method."""
+    monitor.rssi_buffer.clear()
+    for _ in range(11):
+        monitor.rssi_buffer.append(-60)
+
+    with patch("brios.core.monitor.SMOOTHING_METHOD", method):
+        smoothed, distance = monitor._process_signal(-84)
+
+    assert smoothed == pytest.approx(expected)
+    assert distance is not None
+
+
+def test_process_signal_kalman(monitor: Any) -> None:
+    """Test that the Kalman method filters the window median."""
+    with (
+        patch("brios.core.monitor.SMOOTHING_METHOD", "kalman"),
+        patch("brios.core.monitor.KALMAN_PROCESS_NOISE", 0.0),
+        patch("brios.core.monitor.KALMAN_MEASUREMENT_NOISE", 1.0),
+    ):
+        monitor.rssi_buffer.clear()
+        for _ in range(11):
+            monitor.rssi_buffer.append(-60)
+
+        smoothed, distance = monitor._process_signal(-60)
+        assert smoothed == pytest.approx(-60.0)  # first median is taken as is
+        assert distance is not None
+
+        for _ in range(12):
+            monitor.rssi_buffer.append(-70)
+        # Gain 0.5 with no process noise: halfway to the new median
+        smoothed, _ = monitor._process_signal(-70)
+        assert smoothed == pytest.approx(-65.0)
+
+        monitor._reset_smoothing()
+        assert monitor.kalman_rssi is None
+        assert len(monitor.rssi_buffer) == 0
+
+
+def test_process_signal_memoizes_distance(monitor: Any) -> None:
+    """Test that a repeated smoothed value reuses its distance."""
+    monitor.rssi_buffer.clear()
+    for _ in range(11):
+        monitor.rssi_buffer.append(-60)
+
+    with patch(
+        "brios.core.monitor.estimate_distance", return_value=1.5
+    ) as mock_estimate:
+        assert monitor._process_signal(-60) == (-60.0, 1.5)
+        assert monitor._process_signal(-60) == (-60.0, 1.5)
+
+    mock_estimate.assert_called_once_with(-60.0)
+
+
+def test_timestamp_cached_per_second(monitor: Any) -> None:
+    """Test that the formatted timestamp is only rebuilt once per second."""
+    with patch("brios.core.monitor.time.time", return_value=1000.2):
+        first = monitor._timestamp()
+    with (
+        patch("brios.core.monitor.time.time", return_value=1000.9),
+        patch("brios.core.monitor.datetime") as mock_datetime,
+    ):
+        assert monitor._timestamp() == first
+        mock_datetime.fromtimestamp.assert_not_called()
+
+
+def test_log_status_skips_unchanged_readings(monitor: Any) -> None:
+    """Test that status lines are only printed when the reading changes."""
+    with patch("builtins.print") as mock_print:
+        monitor._log_status(-60, -60.0, 1.0)
+        monitor._log_status(-61, -60.4, 1.1)
+        assert mock_print.call_count == 1
+
+        monitor._log_status(-65, -62.0, 1.1)
+        assert mock_print.call_count == 2
+
+
+def test_log_status_silent_mode_skips_formatting(monitor: Any) -> None:
+    """Test that no timestamp is built when nothing would be logged."""
+    monitor.flags.verbose = False
+    monitor.flags.file_logging = False
+
+    with patch.object(monitor, "_timestamp") as mock_timestamp:
+        monitor._log_status(-60, -60.0, 1.0)
+        mock_timestamp.assert_not_called()
+
+    # Daemon output only goes to the log file, so without one it is silent.
+    monitor.flags.verbose = True
+    monitor.flags.daemon_mode = True
+    monitor.log_file = None
+    with patch.object(monitor, "_timestamp") as mock_timestamp:
+        monitor._log_status(-60, -60.0, 1.0)
+        mock_timestamp.assert_not_called()
+
+
+def test_log_status_does_not_flush(monitor: Any) -> None:
+    """Test that status lines are left in the log file buffer."""
+    monitor.flags.daemon_mode = True
+    monitor.log_file = MagicMock()
+
+    monitor._log_status(-60, -60.0, 1.0)
+
+    monitor.log_file.write.assert_called_once()
+    monitor.log_file.flush.assert_not_called()
+
+
+def test_emit_routes_by_mode(monitor: Any) -> None:
+    """Test that messages reach the log file once and the terminal in color."""
+    monitor.log_file = MagicMock()
+    monitor.flags.file_logging = True
+
+    monitor.flags.daemon_mode = True
+    with patch("builtins.print") as mock_print:
+        monitor._emit("plain", "rich")
+    mock_print.assert_not_called()
+    monitor.log_file.write.assert_called_once_with("plain\n")
+
+    monitor.log_file.reset_mock()
+    monitor.flags.daemon_mode = False
+    with patch("builtins.print") as mock_print:
+        monitor._emit("plain", "rich", flush=True)
+    mock_print.assert_called_once_with("rich")
+    monitor.log_file.write.assert_called_once_with("plain\n")
+    monitor.log_file.flush.assert_called_once()
+
+
+def test_watchdog_interval_backs_off_when_idle(monitor: Any) -> None:
+    """Test that the watchdog slows down while healthy and resets on locks."""
+    import time
+
+    monitor.last_packet_time = time.monotonic()
+    intervals = [monitor._next_watchdog_interval(False) for _ in range(6)]
+
+    assert intervals[0] == pytest.approx(3.0)
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == 10.0
+
+    assert monitor._next_watchdog_interval(True) == 2.0
+
+
+def test_foreign_packet_is_ignored(
+    monitor: Any, mock_device: MagicMock, mock_adv: MagicMock
+) -> None:
+    """Test that non-target advertisements leave the liveness clock alone."""
+    monitor.last_packet_time = 0.0
+    mock_device.address = "11:22:33:44:55:66"
+
+    monitor._detection_callback(mock_device, mock_adv)
 
-    monitor.lock_history.append(now)
-    monitor.lock_history.append(now + 1)
-    monitor.lock_history.append(now + 2)
+    assert monitor.last_packet_time == 0.0
+    assert monitor._pending_rssi == []
+
+
+@pytest.mark.asyncio
+async def test_address_match_is_case_insensitive_and_memoized(
+    monitor: Any, mock_device: MagicMock, mock_adv: MagicMock
+) -> None:
+    """Test that address matching ignores case and is cached per address."""
+    mock_adv.rssi = -60
+    mock_device.address = "aa:bb:cc:dd:ee:ff"
+    monitor._detection_callback(mock_device, mock_adv)
+    assert monitor._pending_rssi == [-60]
+
+    mock_device.address = "11:22:33:44:55:66"
+    monitor._detection_callback(mock_device, mock_adv)
+    assert monitor._pending_rssi == [-60]
+
+    assert monitor._address_matches == {
+        "aa:bb:cc:dd:ee:ff": True,
+        "11:22:33:44:55:66": False,
+    }
+
+
+def test_malformed_rssi_is_reported(
+    monitor: Any, mock_device: MagicMock, mock_adv: MagicMock
+) -> None:
+    """Test that a target packet without an RSSI goes to the error path."""
+    mock_adv.rssi = None
+
+    with patch.object(monitor, "_handle_bleak_error") as mock_handler:
+        monitor._detection_callback(mock_device, mock_adv)
+
+    mock_handler.assert_called_once()
+    assert monitor._error_count == 1
+    assert monitor._pending_rssi == []
+
+
+def test_bleak_error_reports_are_rate_limited(
+    monitor: Any, capsys: Any
+) -> None:
+    """Test that a malformed-packet storm prints one report per interval."""
+    with patch(
+        "brios.core.monitor.time.monotonic", side_effect=[100, 101, 106]
+    ):
+        monitor._handle_bleak_error()
+        monitor._handle_bleak_error()
+        assert capsys.readouterr().out.count("Malformed Packet") == 1
+
+        monitor._handle_bleak_error()
+        assert capsys.readouterr().out.count("Malformed Packet") == 1
+
+
+@pytest.mark.asyncio
+async def test_burst_is_drained_once(
+    monitor: Any, mock_device: MagicMock, mock_adv: MagicMock
+) -> None:
+    """Test that a burst of advertisements is evaluated in a single drain."""
+    monitor.rssi_buffer.clear()
+    for _ in range(9):
+        monitor.rssi_buffer.append(-60)
+
+    with patch.object(
+        monitor, "_log_status", wraps=monitor._log_status
+    ) as mock_log:
+        for rssi in (-60, -61, -62):
+            mock_adv.rssi = rssi
+            monitor._detection_callback(mock_device, mock_adv)
+
+        assert mock_log.call_count == 0
+        await asyncio.sleep(0)
+
+        assert len(monitor.rssi_buffer) == 12
+        mock_log.assert_called_once()
+        assert mock_log.call_args.args[0] == -62
+
+
+@pytest.mark.asyncio
+async def test_drain_errors_are_reported(monitor: Any) -> None:
+    """Test that a failing drain goes through the generic error handler."""
+    monitor._pending_rssi = [-60]
+    error = OSError("disk full")
+
+    with (
+        patch.object(monitor, "_process_signal", side_effect=error),
+        patch.object(monitor, "_handle_generic_error") as mock_handle,
+    ):
+        monitor._drain_pending()
+
+    mock_handle.assert_called_once_with(error)
+    assert monitor._error_count == 1
+    assert monitor._pending_rssi == []
+
+
+def test_screen_lock_probe_is_memoized(monitor: Any) -> None:
+    """Test that the screen lock state is reused within the cache TTL."""
+    with patch(
+        "brios.core.monitor.system.is_screen_locked", return_value=True
+    ) as mock_locked:
+        assert monitor._is_screen_locked() is True
+        assert monitor._is_screen_locked() is True
+        mock_locked.assert_called_once()
+
+        monitor._lock_cache_ts -= 5.0
+        monitor._is_screen_locked()
+        assert mock_locked.call_count == 2
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _fast_sleep(_delay: float) -> None:
+    """Replacement for asyncio.sleep that only yields to the loop."""
+    await _real_sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_lock_handler_wakes_on_unlock_event(monitor: Any) -> None:
+    """Test that the lock handler resumes as soon as the unlock event fires."""
+    monitor.scanner = MagicMock()
+    monitor.scanner.stop = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    monitor.scanner.start = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    locked = [True]
+
+    with (
+        patch.object(
+            monitor, "_is_screen_locked", side_effect=lambda: locked[0]
+        ),
+        patch("brios.core.monitor.asyncio.sleep", new=_fast_sleep),
+        patch("brios.core.monitor._UNLOCK_RECHECK_SECONDS", 60.0),
+    ):
+        task = asyncio.create_task(monitor._handle_screen_lock())
+        for _ in range(5):
+            await _fast_sleep(0)
+        assert not task.done()
+
+        locked[0] = False
+        monitor._unlocked.set()
+        await asyncio.wait_for(task, timeout=1.0)
+
+    assert monitor.is_handling_lock is False
+    monitor.scanner.start.assert_called_once()  # same scanner, restarted
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_restart_for_silent_target(monitor: Any) -> None:
+    """Test that restarts for a silent target are not lock events."""
+    monitor.scanner = MagicMock()
+    monitor.scanner.stop = AsyncMock()
+    monitor.scanner.start = AsyncMock()
+
+    with (
+        patch.object(monitor, "_is_screen_locked", return_value=False),
+        patch.object(monitor, "_new_scanner", return_value=monitor.scanner),
+        patch("brios.core.monitor.asyncio.sleep", new=_fast_sleep),
+        patch("builtins.print") as mock_print,
+    ):
+        for _ in range(5):
+            monitor.last_packet_time = time.monotonic() - 200
+            monitor._scanner_frozen = True  # as set by the heartbeat
+            await monitor._handle_screen_lock()
+
+            # The restart counts as fresh data, so the next tick is quiet
+            assert time.monotonic() - monitor.last_packet_time < 5
+
+    assert monitor._lock_history_count == 0
+    assert monitor.scanner.start.await_count == 5
+    printed = "".join(str(c.args[0]) for c in mock_print.call_args_list)
+    assert "Screen locked" not in printed
+    assert "LOCK LOOP" not in printed
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_restart_rebuilds_scanner(monitor: Any) -> None:
+    """Test that a frozen scanner is replaced instead of restarted."""
+    frozen_scanner = MagicMock()
+    frozen_scanner.stop = AsyncMock()
+    monitor.scanner = frozen_scanner
+    fresh_scanner = MagicMock()
+    fresh_scanner.start = AsyncMock()
+    monitor._scanner_frozen = True
+
+    with (
+        patch.object(monitor, "_is_screen_locked", return_value=False),
+        patch.object(monitor, "_new_scanner", return_value=fresh_scanner),
+        patch("brios.core.monitor.asyncio.sleep", new=_fast_sleep),
+        patch("builtins.print"),
+    ):
+        await monitor._handle_screen_lock()
+
+    frozen_scanner.stop.assert_awaited_once()
+    frozen_scanner.start.assert_not_called()
+    fresh_scanner.start.assert_awaited_once()
+    assert monitor.scanner is fresh_scanner
+
+
+@pytest.mark.asyncio
+async def test_run_returns_when_stopped(monitor: Any) -> None:
+    """Test that run() idles on the stop event and shuts down cleanly."""
+    monitor.scanner = MagicMock()
+    monitor.scanner.start = AsyncMock()
+    monitor.scanner.stop = AsyncMock()
+
+    with (
+        patch.object(monitor, "_setup_logging"),
+        patch.object(monitor, "_print_start_status"),
+        patch.object(monitor, "_start_lock_worker"),
+        patch.object(monitor, "_watchdog_loop", new=AsyncMock()),
+        patch("builtins.print"),
+    ):
+        task = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        monitor.stop()
+        await asyncio.wait_for(task, timeout=1.0)
+
+    monitor.scanner.stop.assert_awaited_once()
+
+
+def test_prepare_lock_failure_is_reported(monitor: Any) -> None:
+    """Test that a failed password policy write warns instead of raising."""
+    with (
+        patch(
+            "brios.core.monitor.system.prepare_lock",
+            side_effect=OSError("no defaults"),
+        ),
+        patch("builtins.print") as mock_print,
+    ):
+        monitor._prepare_lock()
+
+    assert "no defaults" in mock_print.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_run_signals_ready_after_scanner_starts(monitor: Any) -> None:
+    """Test that run() reports readiness only once the scanner is up."""
+    monitor.scanner = MagicMock()
+    monitor.scanner.start = AsyncMock()
+    monitor.scanner.stop = AsyncMock()
+    on_ready = MagicMock()
+
+    with (
+        patch.object(monitor, "_setup_logging"),
+        patch.object(monitor, "_print_start_status"),
+        patch.object(monitor, "_start_lock_worker"),
+        patch.object(monitor, "_watchdog_loop", new=AsyncMock()),
+        patch("builtins.print"),
+    ):
+        task = asyncio.create_task(monitor.run(on_ready=on_ready))
+        await asyncio.sleep(0)
+        on_ready.assert_called_once_with()
+
+        monitor.stop()
+        await asyncio.wait_for(task, timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_signal_ready_if_scanner_fails(
+    monitor: Any,
+) -> None:
+    """Test that a scanner start failure never reports readiness."""
+    monitor.scanner = MagicMock()
+    monitor.scanner.start = AsyncMock(side_effect=RuntimeError("BT off"))
+    monitor.scanner.stop = AsyncMock()
+    monitor.flags.daemon_mode = True
+    on_ready = MagicMock()
+
+    with (
+        patch.object(monitor, "_setup_logging"),
+        patch.object(monitor, "_print_start_status"),
+        patch("builtins.print"),
+        pytest.raises(SystemExit),
+    ):
+        await monitor.run(on_ready=on_ready)
 
-    assert len(monitor.lock_history) == 3
+    on_ready.assert_not_called()
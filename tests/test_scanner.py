@@ -0,0 +1,135 @@
+import pytest
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from brios.core.scanner import DeviceScanner
+
+
+def _make_entry(address: str, name: Any, rssi: int) -> tuple:
+    """Builds a (device, adv_data) pair as returned by BleakScanner.
+
+    Args:
+        address: The device address.
+        name: The advertised device name, or None.
+        rssi: The RSSI value in dBm.
+
+    Returns:
+        A tuple of mocks standing in for BLEDevice and AdvertisementData.
+    """
+    device = MagicMock()
+    device.address = address
+    device.name = name
+    adv = MagicMock()
+    adv.rssi = rssi
+    return device, adv
+
+
+@pytest.fixture
+def scanner() -> DeviceScanner:
+    """Creates a DeviceScanner with a short duration.
+
+    Returns:
+        A DeviceScanner instance.
+    """
+    return DeviceScanner(duration=5, use_bdaddr=True, verbose=True)
+
+
+def test_print_results_lists_devices(
+    scanner: DeviceScanner, capsys: Any
+) -> None:
+    """Tests that every discovered device is printed on its own row."""
+    devices = [
+        _make_entry("AA:BB:CC:DD:EE:01", "Phone", -45),
+        _make_entry("AA:BB:CC:DD:EE:02", None, -80),
+    ]
+
+    scanner._print_results(devices)
+
+    out = capsys.readouterr().out
+    assert "(2 devices found)" in out
+    assert " 1. Phone" in out
+    assert "AA:BB:CC:DD:EE:01" in out
+    assert " 2. " in out and "(Unknown)" in out
+    assert "AA:BB:CC:DD:EE:02" in out
+    assert out.endswith("m\n")
+
+
+def test_print_results_no_devices(scanner: DeviceScanner, capsys: Any) -> None:
+    """Tests the output when the scan found nothing."""
+    scanner._print_results([])
+
+    out = capsys.readouterr().out
+    assert "(0 devices found)" in out
+    assert "No devices found" in out
+
+
+def _fake_scanner(entries: list) -> Any:
+    """Builds a BleakScanner stand-in that replays advertisements.
+
+    Args:
+        entries: The (device, adv_data) pairs to deliver on start.
+
+    Returns:
+        A class usable as ``async with BleakScanner(...)``.
+    """
+
+    class FakeScanner:
+
+        def __init__(self, detection_callback: Any, **kwargs: Any) -> None:
+            self.callback = detection_callback
+
+        async def __aenter__(self) -> "FakeScanner":
+            for device, adv in entries:
+                self.callback(device, adv)
+            return self
+
+        async def __aexit__(self, *exc: Any) -> None:
+            return None
+
+    return FakeScanner
+
+
+@pytest.mark.asyncio
+async def test_run_sorts_devices_by_address(scanner: DeviceScanner) -> None:
+    """Tests that discovered devices are listed in address order."""
+    second = _make_entry("BB:00:00:00:00:02", "B", -50)
+    first = _make_entry("AA:00:00:00:00:01", "A", -60)
+
+    with (
+        patch(
+            "brios.core.scanner.BleakScanner", _fake_scanner([second, first])
+        ),
+        patch("brios.core.scanner.asyncio.sleep", new=AsyncMock()),
+        patch.object(scanner, "_print_summary"),
+        patch.object(scanner, "_print_results") as mock_print,
+    ):
+        await scanner.run()
+
+    mock_print.assert_called_once_with([first, second])
+
+
+@pytest.mark.asyncio
+async def test_run_announces_each_device_once(
+    scanner: DeviceScanner, capsys: Any
+) -> None:
+    """Tests that devices are printed as found and keep their latest data."""
+    early = _make_entry("AA:00:00:00:00:01", "Phone", -70)
+    late = _make_entry("AA:00:00:00:00:01", "Phone", -40)
+    other = _make_entry("BB:00:00:00:00:02", None, -80)
+
+    with (
+        patch(
+            "brios.core.scanner.BleakScanner",
+            _fake_scanner([early, other, late]),
+        ),
+        patch("brios.core.scanner.asyncio.sleep", new=AsyncMock()),
+        patch.object(scanner, "_print_summary"),
+        patch.object(scanner, "_print_results") as mock_print,
+    ):
+        await scanner.run()
+
+    out = capsys.readouterr().out
+    assert out.count("AA:00:00:00:00:01") == 1
+    assert " -70 dBm  Phone" in out
+    assert "(Unknown)" in out
+    mock_print.assert_called_once_with([late, other])
@@ -0,0 +1,293 @@
+import os
+import sys
+import select
+import argparse
+import pytest
+from typing import Any
+from unittest.mock import patch
+
+from brios.core.service import ServiceManager
+
+
+@pytest.fixture
+def pid_file(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Redirects the service PID file into a temporary directory.
+
+    Returns:
+        The path of the temporary PID file.
+    """
+    path = str(tmp_path / ".ble_monitor.pid")
+    monkeypatch.setattr("brios.core.service.PID_FILE", path)
+    monkeypatch.setattr(
+        "brios.core.service.PAUSE_FILE", str(tmp_path / ".ble_monitor.pause")
+    )
+    return path
+
+
+@pytest.fixture
+def manager() -> ServiceManager:
+    """Creates a ServiceManager with empty arguments.
+
+    Returns:
+        A ServiceManager instance.
+    """
+    return ServiceManager(argparse.Namespace())
+
+
+def test_pid_status_missing_file(
+    manager: ServiceManager, pid_file: str
+) -> None:
+    """Tests that a missing PID file reports a stopped service."""
+    assert manager._get_pid_status() == (None, False)
+
+
+def test_pid_status_running(manager: ServiceManager, pid_file: str) -> None:
+    """Tests that a PID file pointing at a live process reports running."""
+    with open(pid_file, "w") as f:
+        f.write(str(os.getpid()))
+
+    assert manager._get_pid_status() == (os.getpid(), True)
+
+
+def test_pid_status_corrupt_file(
+    manager: ServiceManager, pid_file: str
+) -> None:
+    """Tests that an unparsable PID file is treated as not running."""
+    with open(pid_file, "w") as f:
+        f.write("not-a-pid")
+
+    assert manager._get_pid_status() == (None, False)
+
+
+def test_pid_status_is_cached(manager: ServiceManager, pid_file: str) -> None:
+    """Tests that repeated checks reuse the cached result until invalidated."""
+    with open(pid_file, "w") as f:
+        f.write(str(os.getpid()))
+
+    with patch.object(
+        manager, "_read_pid_status", wraps=manager._read_pid_status
+    ) as mock_read:
+        manager._get_pid_status()
+        manager._get_pid_status()
+        assert mock_read.call_count == 1
+
+        manager._invalidate_pid_cache()
+        manager._get_pid_status()
+        assert mock_read.call_count == 2
+
+
+def test_pid_status_rereads_rewritten_file(
+    manager: ServiceManager, pid_file: str
+) -> None:
+    """Tests that a PID file with a new mtime bypasses the cache."""
+    with open(pid_file, "w") as f:
+        f.write(str(os.getpid()))
+    os.utime(pid_file, ns=(1_000_000_000, 1_000_000_000))
+    assert manager._get_pid_status() == (os.getpid(), True)
+
+    with open(pid_file, "w") as f:
+        f.write("not-a-pid")
+    os.utime(pid_file, ns=(2_000_000_000, 2_000_000_000))
+    assert manager._get_pid_status() == (None, False)
+
+
+def test_stop_when_not_running_invalidates_cache(
+    manager: ServiceManager, pid_file: str, capsys: Any
+) -> None:
+    """Tests that stop() clears a stale PID file and the cached status."""
+    with open(pid_file, "w") as f:
+        f.write("not-a-pid")
+
+    manager.stop()
+
+    assert not os.path.exists(pid_file)
+    assert manager._pid_cache is None
+    assert "is not running" in capsys.readouterr().out
+
+
+def test_reconstruct_command_forwards_options() -> None:
+    """Tests that the daemon command keeps the mode and always logs."""
+    args = argparse.Namespace(
+        target_mac="AA:BB:CC:DD:EE:FF",
+        target_uuid=None,
+        scanner=None,
+        macos_use_bdaddr=True,
+        verbose=False,
+    )
+    with (
+        patch("sys.argv", ["brios"]),
+        patch("shutil.which", return_value="/usr/local/bin/brios"),
+    ):
+        command = ServiceManager(args)._reconstruct_command()
+
+    assert command == [
+        "/usr/local/bin/brios",
+        "--target-mac",
+        "AA:BB:CC:DD:EE:FF",
+        "-m",
+        "-f",
+        "-v",
+        "--daemon",
+    ]
+
+
+def test_display_status_stopped(
+    manager: ServiceManager, pid_file: str, capsys: Any
+) -> None:
+    """Tests the status printout when no daemon is running."""
+    manager.display_status()
+
+    out = capsys.readouterr().out
+    assert "● STOPPED" in out
+    assert "PID File:   Not found" in out
+    assert out.endswith("─" * 50 + "\n\n")
+
+
+def test_wait_for_daemon_returns_once_signalled() -> None:
+    """Tests that the start wait ends as soon as the daemon signals."""
+    from brios.core.service import _wait_for_daemon
+
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"1")
+    assert _wait_for_daemon(read_fd, timeout=5.0) is True
+
+    assert select.select([read_fd], [], [], 0)[0] == []  # byte consumed
+    os.close(write_fd)
+    os.close(read_fd)
+
+
+def test_wait_for_daemon_returns_when_daemon_exits() -> None:
+    """Tests that the start wait ends when the daemon dies early."""
+    from brios.core.service import _wait_for_daemon
+
+    read_fd, write_fd = os.pipe()
+    os.close(write_fd)  # As if the daemon exited without signalling
+    assert _wait_for_daemon(read_fd, timeout=5.0) is False
+    os.close(read_fd)
+
+
+def test_wait_for_daemon_times_out() -> None:
+    """Tests that a daemon still starting up is told apart from a failure."""
+    from brios.core.service import _wait_for_daemon
+
+    read_fd, write_fd = os.pipe()
+    assert _wait_for_daemon(read_fd, timeout=0.01) is None
+    os.close(write_fd)
+    os.close(read_fd)
+
+
+def test_start_reports_failure_without_ready_signal(
+    pid_file: str, tmp_path: Any, capsys: Any
+) -> None:
+    """Tests that start() fails if the daemon never reports its scanner up.
+
+    The PID file names a live process, as it does while a daemon whose
+    scanner failed to start is still shutting down.
+    """
+    args = argparse.Namespace(
+        target_mac="AA:BB:CC:DD:EE:FF",
+        target_uuid=None,
+        scanner=None,
+        macos_use_bdaddr=False,
+        verbose=False,
+    )
+
+    def spawn(command: Any, stderr_fd: int, ready_fd: int) -> int:
+        with open(pid_file, "w") as f:
+            f.write(str(os.getpid()))
+        return os.getpid()  # never writes to ready_fd
+
+    with (
+        patch("brios.core.service.LOG_FILE", str(tmp_path / "brios.log")),
+        patch("brios.core.service._spawn_daemon", side_effect=spawn),
+    ):
+        ServiceManager(args).start()
+
+    out = capsys.readouterr().out
+    assert "Failed to start" in out
+    assert "started successfully" not in out
+
+
+def test_start_reports_slow_daemon_as_starting(
+    pid_file: str, tmp_path: Any, capsys: Any
+) -> None:
+    """Tests that a live daemon that has not reported back is not a failure."""
+    args = argparse.Namespace(
+        target_mac="AA:BB:CC:DD:EE:FF",
+        target_uuid=None,
+        scanner=None,
+        macos_use_bdaddr=False,
+        verbose=False,
+    )
+
+    def spawn(command: Any, stderr_fd: int, ready_fd: int) -> int:
+        with open(pid_file, "w") as f:
+            f.write(str(os.getpid()))
+        return os.getpid()  # never writes to ready_fd
+
+    with (
+        patch("brios.core.service.LOG_FILE", str(tmp_path / "brios.log")),
+        patch("brios.core.service._spawn_daemon", side_effect=spawn),
+        patch("brios.core.service._wait_for_daemon", return_value=None),
+    ):
+        ServiceManager(args).start()
+
+    out = capsys.readouterr().out
+    assert "still starting" in out
+    assert "Failed to start" not in out
+
+
+def test_notify_daemon_ready(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that the daemon signals and closes the inherited pipe."""
+    from brios.core.service import DAEMON_READY_FD_ENV, notify_daemon_ready
+
+    read_fd, write_fd = os.pipe()
+    monkeypatch.setenv(DAEMON_READY_FD_ENV, str(write_fd))
+
+    notify_daemon_ready()
+
+    assert os.read(read_fd, 2) == b"1"
+    assert os.read(read_fd, 1) == b""  # write end was closed
+    assert DAEMON_READY_FD_ENV not in os.environ
+    os.close(read_fd)
+    notify_daemon_ready()  # no-op once consumed
+
+
+def test_spawn_daemon_detaches_and_redirects(tmp_path: Any) -> None:
+    """Tests that the daemon gets a new session, stderr and the pipe."""
+    from brios.core.service import DAEMON_READY_FD_ENV, _spawn_daemon
+
+    log_path = tmp_path / "daemon.log"
+    script = (
+        "import os, sys; "
+        "sys.stderr.write(str(os.getsid(0) == os.getpid())); "
+        f"os.write(int(os.environ['{DAEMON_READY_FD_ENV}']), b'1')"
+    )
+    read_fd, write_fd = os.pipe()
+    with open(log_path, "a") as log:
+        pid = _spawn_daemon(
+            [sys.executable, "-c", script], log.fileno(), write_fd
+        )
+    os.close(write_fd)
+
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b"1"
+    os.close(read_fd)
+    assert log_path.read_text() == "True"
+
+
+def test_stop_keeps_pid_file_if_daemon_survives(
+    manager: ServiceManager, pid_file: str, capsys: Any
+) -> None:
+    """Tests that stop() does not report success for a live daemon."""
+    with open(pid_file, "w") as f:
+        f.write(str(os.getpid()))
+
+    with patch(
+        "brios.core.service.terminate_process", return_value=False
+    ) as mock_terminate:
+        manager.stop()
+
+    mock_terminate.assert_called_once_with(os.getpid(), 5.0)
+    assert os.path.exists(pid_file)
+    assert "did not exit" in capsys.readouterr().out
@@ -102,12 +102,12 @@ class TestIsNewer:
 class TestCache:
     """Tests for _read_cache() and _write_cache()."""
 
-    @patch("brios.core.updater.os.path.exists", return_value=False)
-    def test_read_cache_missing_file(self, _mock_exists: MagicMock) -> None:
+    @patch("builtins.open", side_effect=FileNotFoundError)
+    def test_read_cache_missing_file(self, _mock_open: MagicMock) -> None:
         """Verifies that a missing cache file returns None.
 
         Args:
-            _mock_exists: Mocked os.path.exists returning False.
+            _mock_open: Mocked open raising FileNotFoundError.
         """
         assert _read_cache() is None
 
@@ -115,26 +115,16 @@ class TestCache:
         "builtins.open",
         mock_open(read_data='{"last_check": 100, "latest_version": "1.0.0"}'),
     )
-    @patch("brios.core.updater.os.path.exists", return_value=True)
-    def test_read_cache_valid(self, _mock_exists: MagicMock) -> None:
-        """Verifies that a valid cache file is read and parsed correctly.
-
-        Args:
-            _mock_exists: Mocked os.path.exists returning True.
-        """
+    def test_read_cache_valid(self) -> None:
+        """Verifies that a valid cache file is read and parsed correctly."""
         result = _read_cache()
         assert result is not None
         assert result["latest_version"] == "1.0.0"
         assert result["last_check"] == 100
 
     @patch("builtins.open", mock_open(read_data="NOT JSON"))
-    @patch("brios.core.updater.os.path.exists", return_value=True)
-    def test_read_cache_corrupt(self, _mock_exists: MagicMock) -> None:
-        """Verifies that a corrupt cache file returns None.
-
-        Args:
-            _mock_exists: Mocked os.path.exists returning True.
-        """
+    def test_read_cache_corrupt(self) -> None:
+        """Verifies that a corrupt cache file returns None."""
         assert _read_cache() is None
 
     @patch("brios.core.updater.os.makedirs")
@@ -1,3 +1,4 @@
+import os
 import sys
 import pytest
 from unittest.mock import MagicMock, patch
@@ -29,6 +30,65 @@ def test_estimate_distance() -> None:
     ) == pytest.approx(10.0)
 
 
+def test_estimate_distance_lookup_matches_formula() -> None:
+    """Test that table lookups agree with the exact model."""
+    from brios.core.config import PATH_LOSS_EXPONENT, TX_POWER_AT_1M
+    from brios.core.utils import estimate_distance
+
+    for rssi in (-100, -80, -59.0, -40, 10):
+        expected = 10 ** ((TX_POWER_AT_1M - rssi) / (10 * PATH_LOSS_EXPONENT))
+        assert estimate_distance(rssi) == pytest.approx(expected)
+
+    # Fractional (smoothed) values are not rounded to the table
+    assert estimate_distance(-70.5) != estimate_distance(-70)
+    assert estimate_distance(-70.5) != estimate_distance(-71)
+
+
+@pytest.mark.parametrize("value", ["0", "-1.5", "abc"])
+def test_invalid_path_loss_exponent_falls_back(
+    value: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an unusable PATH_LOSS_EXPONENT reverts to the default."""
+    import brios.core.config as config
+
+    monkeypatch.setenv("PATH_LOSS_EXPONENT", value)
+    try:
+        assert importlib.reload(config).PATH_LOSS_EXPONENT == 2.8
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
+
+
+@pytest.mark.parametrize(
+    "process, measurement, expected",
+    [
+        ("0", "0", (0.0, 4.0)),
+        ("-1", "-2", (0.5, 4.0)),
+        ("abc", "1.5", (0.5, 1.5)),
+    ],
+)
+def test_invalid_kalman_noise_falls_back(
+    process: str,
+    measurement: str,
+    expected: tuple,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that unusable Kalman noise variances revert to the defaults."""
+    import brios.core.config as config
+
+    monkeypatch.setenv("KALMAN_PROCESS_NOISE", process)
+    monkeypatch.setenv("KALMAN_MEASUREMENT_NOISE", measurement)
+    try:
+        importlib.reload(config)
+        assert (
+            config.KALMAN_PROCESS_NOISE,
+            config.KALMAN_MEASUREMENT_NOISE,
+        ) == expected
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
+
+
 def test_smooth_rssi() -> None:
     """Test RSSI averaging."""
     from brios.core.utils import smooth_rssi
@@ -42,6 +102,53 @@ def test_smooth_rssi() -> None:
     assert smooth_rssi(deque()) is None
 
 
+def test_rssi_buffer_running_sum() -> None:
+    """Test the ring buffer keeps a deque-like window and its sum."""
+    from brios.core.utils import RssiBuffer, smooth_rssi
+
+    buffer = RssiBuffer(3)
+    assert len(buffer) == 0
+    assert smooth_rssi(buffer) is None
+
+    for rssi in (-60, -70, -80, -90):
+        buffer.append(rssi)
+
+    assert list(buffer) == [-70, -80, -90]
+    assert buffer.total == -240
+    assert smooth_rssi(buffer, "mean") == -80.0
+    assert smooth_rssi(buffer, "median") == -80.0
+    assert sorted(buffer.values()) == [-90, -80, -70]
+
+    buffer.clear()
+    buffer.append(-50)
+    buffer.append(-55)
+    assert list(buffer.values()) == [-50, -55]
+    assert smooth_rssi(buffer, "median") == -52.5
+
+    buffer.clear()
+    assert len(buffer) == 0 and list(buffer) == []
+
+
+def test_signal_color() -> None:
+    """Test the RSSI to display color buckets."""
+    from brios.core.utils import Colors, signal_color
+
+    assert signal_color(-40) == Colors.GREEN
+    assert signal_color(-50) == Colors.YELLOW
+    assert signal_color(-69.5) == Colors.YELLOW
+    assert signal_color(-70) == Colors.RED
+    assert signal_color(-95) == Colors.RED
+
+
+def test_signal_strength() -> None:
+    """Test the RSSI to (color, label) classification."""
+    from brios.core.utils import Colors, signal_strength
+
+    assert signal_strength(-40) == (Colors.GREEN, "Strong")
+    assert signal_strength(-60) == (Colors.YELLOW, "Medium")
+    assert signal_strength(-80) == (Colors.RED, "Weak")
+
+
 def test_determine_target_address() -> None:
     """Test logic for picking MAC vs UUID."""
     from brios.core.utils import determine_target_address
@@ -58,16 +165,24 @@ def test_determine_target_address() -> None:
     args.target_uuid = "UUID-1234"
     assert determine_target_address(args) == "UUID-1234"
 
-    # Case 3: USE_DEFAULT
-    args.target_mac = "USE_DEFAULT"
+    # Case 3: No explicit target, fall back to the configured addresses
+    args.target_mac = None
+    args.target_uuid = None
     with patch("brios.core.utils.TARGET_DEVICE_MAC_ADDRESS", "DEFAULT_MAC"):
         assert determine_target_address(args) == "DEFAULT_MAC"
 
-    args.target_mac = None
-    args.target_uuid = "USE_DEFAULT"
-    with patch("brios.core.utils.TARGET_DEVICE_UUID_ADDRESS", "DEFAULT_UUID"):
+    with (
+        patch("brios.core.utils.TARGET_DEVICE_MAC_ADDRESS", None),
+        patch("brios.core.utils.TARGET_DEVICE_UUID_ADDRESS", "DEFAULT_UUID"),
+    ):
         assert determine_target_address(args) == "DEFAULT_UUID"
 
+    with (
+        patch("brios.core.utils.TARGET_DEVICE_MAC_ADDRESS", None),
+        patch("brios.core.utils.TARGET_DEVICE_UUID_ADDRESS", None),
+    ):
+        assert determine_target_address(args) is None
+
 
 # --- System Tests ---
 @patch("brios.core.system.IS_MACOS", True)
@@ -141,6 +256,7 @@ def test_lock_macbook_success(mock_run: MagicMock) -> None:
     # Manually set IS_MACOS for test
     with patch("brios.core.system.IS_MACOS", True):
         mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = ""
         from brios.core.system import lock_macbook
 
         success, msg = lock_macbook()
@@ -149,6 +265,48 @@ def test_lock_macbook_success(mock_run: MagicMock) -> None:
         assert mock_run.call_count >= 1
 
 
+@patch("subprocess.run")
+def test_lock_macbook_prepares_once(mock_run: MagicMock) -> None:
+    """Test that the password policy is only written on the first lock."""
+    mock_run.return_value.stdout = "{\n    askForPassword = 0;\n}\n"
+    with (
+        patch("brios.core.system.IS_MACOS", True),
+        patch("brios.core.system._lock_prepared", False),
+    ):
+        from brios.core.system import lock_macbook
+
+        lock_macbook()
+        # One read, two writes, then the lock itself
+        assert mock_run.call_count == 4
+
+        mock_run.reset_mock()
+        lock_macbook()
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["pmset", "displaysleepnow"]
+
+
+@patch("subprocess.run")
+def test_lock_macbook_skips_applied_policy(mock_run: MagicMock) -> None:
+    """Test that an already configured password policy is not rewritten."""
+    mock_run.return_value.stdout = (
+        "{\n    askForPassword = 1;\n    askForPasswordDelay = 0;\n"
+        "    idleTime = 300;\n}\n"
+    )
+    with (
+        patch("brios.core.system.IS_MACOS", True),
+        patch("brios.core.system._lock_prepared", False),
+    ):
+        from brios.core.system import lock_macbook
+
+        success, _ = lock_macbook()
+
+    assert success is True
+    assert [c[0][0][:2] for c in mock_run.call_args_list] == [
+        ["defaults", "read"],
+        ["pmset", "displaysleepnow"],
+    ]
+
+
 def test_lock_macbook_non_macos() -> None:
     """Test locking on non-macOS."""
     import brios.core.system
@@ -159,3 +317,99 @@ def test_lock_macbook_non_macos() -> None:
         success, msg = lock_macbook()
         assert success is False
         assert "Not macOS" in msg
+
+
+def test_format_elapsed() -> None:
+    """Test the ps-style elapsed time formatting."""
+    from brios.core.utils import format_elapsed
+
+    assert format_elapsed(5) == "00:05"
+    assert format_elapsed(3725) == "01:02:05"
+    assert format_elapsed(2 * 86400 + 3725) == "02-01:02:05"
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_process_uptime_linux() -> None:
+    """Test reading the current process uptime from /proc."""
+    import os
+    from brios.core.system import process_uptime
+
+    uptime = process_uptime(os.getpid())
+    assert uptime is not None and 0 <= uptime < 3600
+    assert process_uptime(2**22 + 1) is None
+
+
+def test_tail_lines(tmp_path) -> None:
+    """Test reading trailing lines across block boundaries."""
+    from brios.core.utils import tail_lines
+
+    path = tmp_path / "test.log"
+    path.write_text("".join(f"line {i}\n" for i in range(1000)))
+
+    assert tail_lines(str(path), 3, block_size=16) == [
+        "line 997",
+        "line 998",
+        "line 999",
+    ]
+    path.write_text("only\n")
+    assert tail_lines(str(path), 3) == ["only"]
+
+
+def test_pid_file_roundtrip(tmp_path) -> None:
+    """Test atomic PID file writes and unbuffered reads."""
+    from brios.core.utils import read_pid_file, write_pid_file
+
+    path = str(tmp_path / "test.pid")
+    write_pid_file(path, 4242)
+
+    assert read_pid_file(path) == 4242
+    assert not (tmp_path / "test.pid.tmp").exists()
+
+    with open(path, "w") as f:
+        f.write("garbage")
+    with pytest.raises(ValueError):
+        read_pid_file(path)
+
+    with pytest.raises(FileNotFoundError):
+        read_pid_file(str(tmp_path / "missing.pid"))
+
+
+def test_remove_file_ignores_missing(tmp_path) -> None:
+    """Test that removing a file is idempotent."""
+    from brios.core.utils import remove_file
+
+    path = tmp_path / "test.pid"
+    path.write_text("1")
+    remove_file(str(path))
+    assert not path.exists()
+    remove_file(str(path))
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="reads /proc on Linux"
+)
+def test_is_python_process() -> None:
+    """Test the PID check accepts this interpreter and rejects others."""
+    from brios.core.system import is_python_process
+
+    assert is_python_process(os.getpid())
+    assert not is_python_process(1 << 30)
+
+    with patch("os.readlink", return_value="/usr/sbin/sshd"):
+        assert not is_python_process(os.getpid())
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX signals")
+def test_terminate_process_waits_for_exit() -> None:
+    """Test SIGTERM delivery is confirmed by the process exiting."""
+    import subprocess
+    from brios.core.system import terminate_process
+
+    child = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(30)"]
+    )
+    try:
+        assert terminate_process(child.pid, timeout=5.0)
+    finally:
+        child.kill()
+        child.wait()